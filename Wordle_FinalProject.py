@@ -1,13 +1,27 @@
-import requests
-from random import randint
+import sys
+import time
 from functools import partial
-from pynput import keyboard
 from string import ascii_lowercase
 from tiles import *
+from wordlist import WordlistLoader, WORD_LENGTH, LENGTHS
+from scoring import colors, all_green
+from game import Game, NOT_WORD, NOT_HARD, WIN, LOSE
+from absurdle import AdversarialGame, load_pattern_table
+from multiboard import MultiGame
+from lexicon import Lexicon
+from hints import HintEngine
+from board import BoardModel, BoardRenderer
+from dispatcher import InputDispatcher
+from scheduler import Scheduler, Countdown
+from animation import Animator
+from snapshot import pack_state, unpack_state
+from store import GameStore
+from stats import StatsLog
+from tracing import traced
 
 '''This is a Wordle program built using the Tkinter GUI library. The main file to run is 
 Wordle_FinalProject_PriscillaMiller.py, which pulls some GUI elements from the tiles.py file along with functionality 
-from the requests, random, functools, pynput, tkinter, and string modules. The user can either use their keyboard or 
+from the requests, random, functools, tkinter, and string modules. The user can either use their keyboard or 
 use a mouse and the keyboard presented in the UI to input letters.
  
 Note for game play: This Wordle is designed to function like the NYT Wordle game: A user will make a five-letter guess. 
@@ -20,7 +34,15 @@ guess; the timer resets after each guess. If time runs out, the user automatical
 six times, the user loses. After game play, the user can reset and play again.'''
 
 
+# ------ Value of a "--name N" command-line option ------
+def option(name, default):
+    if name in sys.argv[1:-1]:
+        return int(sys.argv[sys.argv.index(name) + 1])
+    return default
+
+
 # ------ Constants ------
+STARTED = time.perf_counter()  # For the time to first interactive frame
 LT_GRAY = "#D7DBDD"
 DK_GRAY = "#566573"
 GREEN = "#67BD1B"
@@ -30,267 +52,411 @@ BLACK = "#000000"
 FONT_NAME = "Arial"
 WORD_FONT = (FONT_NAME, 14, "bold")
 BUTTON_FONT = (FONT_NAME, 12, "bold")
-TILE_PROPS = {"x": 24, "y": 24, "text": "", "font": WORD_FONT}
+BOARDS = option("--boards", 1)  # Words played at once, each on its own board (4 for Quordle, 8 for Octordle)
+ROWS = option("--guesses", 6 if BOARDS == 1 else BOARDS + 5)  # Guesses allowed, one board row each
+COLUMNS = option("--length", WORD_LENGTH)  # Letters per word, 4 to 8
+if COLUMNS not in LENGTHS or ROWS < 1 or not 1 <= BOARDS <= 8:
+    sys.exit(f"--length must be {LENGTHS.start}-{LENGTHS.stop - 1} letters, --guesses at least 1 and --boards 1-8")
+BOARD_PROPS = {"size": 48, "gap": 4, "font": WORD_FONT, "bg": WHITE, "outline": LT_GRAY, "ink": BLACK}
+MULTI_BOARD_PROPS = {"size": 24, "gap": 2, "spacing": 16, "font": (FONT_NAME, 10, "bold"), "bg": WHITE,
+                     "outline": LT_GRAY, "ink": BLACK}
+KEYBOARD_PROPS = {"width": 40, "height": 48, "gap": 4, "font": BUTTON_FONT, "bg": WHITE, "key_bg": LT_GRAY,
+                  "ink": BLACK}
+TIME_LIMIT = 45  # Seconds per guess
+TICK = 0.1  # Seconds between scheduler ticks; the timer shows tenths of a second
+HARD_MODE = "--hard" in sys.argv  # Every guess must fit the hints revealed so far
+ABSURDLE = "--absurdle" in sys.argv  # The word is not picked in advance; each guess keeps the most answers possible
+ANIMATE = "--no-animation" not in sys.argv  # Tiles flip and pop (see animation.py)
+if BOARDS > 1 and (HARD_MODE or ABSURDLE):
+    sys.exit("--hard and --absurdle play a single board")
+LIST_LIMIT = 12  # Remaining words shown when the counter is clicked
 BUTTON_PROPS = {"font": BUTTON_FONT, "width": 3, "height": 2, "relief": "flat", "borderwidth": 0,
                 "highlightthickness": 0, "bg": LT_GRAY, "fg": BLACK}
 
 
 # ------ Global variables ------
-letters_of_guess = []
-keys_used = {}
-tries = 1
+show_remaining = False
 wordlist = []
-wordle = ""
-game_over = False
-timer = None
+game = None  # Headless game state, see game.py
+clock = Countdown(TIME_LIMIT)
+guess_times = []  # Seconds used on each guess of the current game
+timer_shown = ""
+hint_engine = None
+lexicon = None
+typed = []  # Letters typed before the word list finished loading
+enter_queued = False  # Enter pressed before the word list finished loading
+startup = {}  # Seconds from start to the first interactive frame and to the word list being ready
 
 
 # ------------ Timer functions ------------
 # ------ Reset timer ------
 def reset_timer():
-    window.after_cancel(timer)
-    timer_canvas.itemconfig(timer_text, text=f"Timer: 45 seconds")
-
-
-# ------ Start timer ------
-def start_timer():
-    countdown(45)
-
-
-# ------ Count down ------
-def countdown(count):
-    global game_over
-    count_sec = count % 60
-    if count_sec < 10:
-        count_sec = f"0{count_sec}"
-
-    timer_canvas.itemconfig(timer_text, text=f"Timer: {count_sec} seconds")
-    if count > 0:
-        global timer
-        timer = window.after(1000, countdown, count - 1)
-    else:
+    global timer_shown
+    clock.stop()
+    timer_shown = f"Timer: {TIME_LIMIT} seconds"
+    timer_canvas.itemconfig(timer_text, text=timer_shown)
+
+
+# ------ Start timer (with the full time unless resuming a game) ------
+def start_timer(seconds=None):
+    clock.start(seconds=seconds)
+
+
+# ------ Count down (runs every scheduler tick; time left comes from the monotonic deadline) ------
+def countdown(now):
+    global timer_shown
+    if not clock.running():
+        return
+    if clock.expired(now):
+        time_up()
+        return
+    text = f"Timer: {clock.remaining(now):04.1f} seconds"
+    if text != timer_shown:  # Skip the Tcl call when the shown time has not changed
+        timer_shown = text
+        timer_canvas.itemconfig(timer_text, text=text)
+
+
+# ------ Time ran out; the game decides once, so a guess in the same tick cannot also count ------
+def time_up():
+    clock.stop()
+    if game.expire():
         timer_canvas.itemconfig(timer_text, text=f"Sorry! You ran out of time.")
         send_message("lose")  # send message to user that they lost
         backspace_btn.configure(text="Reset", command=reset)
-        game_over = True
+        finish_game(timeout=True)
+
+
+# ------------ Saving and resuming games (written in the background, see store.py) ------------
+# ------ Snapshot file for the options played, so a game saved with other options is kept for when they are used ------
+def snapshot_name():
+    name = "current_game"
+    if COLUMNS != WORD_LENGTH:
+        name += f"-{COLUMNS}"
+    if ROWS != 6:
+        name += f"-{ROWS}rows"
+    if HARD_MODE:
+        name += "-hard"
+    if ABSURDLE:
+        name += "-absurdle"
+    return name
+
+
+# ------ Snapshot of the game in progress ------
+def save_game():
+    if BOARDS == 1:  # Multi-board games are neither saved nor logged
+        store.save_snapshot(pack_state(game, clock.remaining()))
+
+
+# ------ Keep a finished game and log it for the stats; there is nothing left to resume ------
+def finish_game(timeout=False):
+    if BOARDS > 1:
+        return
+    record = {"answer": game.answer, "guesses": game.guesses, "won": game.won, "timeout": timeout,
+              "times": guess_times}
+    store.record(game, pack_state(game, 0), stats_log.add(record))  # Stats counters update right away
+    store.clear_snapshot()
+
+
+# ------ Replay a snapshot left by a closed or crashed game; returns the seconds it had left ------
+def restore_game():
+    if BOARDS > 1:
+        return None
+    data = store.load_snapshot()
+    state = unpack_state(data, game) if data else None
+    if state is None:
+        return None
+    answer, guesses, remaining = state
+    if game.mode == "absurdle":  # Nothing to restore but the guesses: replaying them makes the same choices again
+        game.reset()
+    else:
+        game.reset(answer)
+    guess_times.extend([None] * len(guesses))  # Not in the snapshot
+    for guess in guesses:
+        if game.submit(guess) in (NOT_WORD, NOT_HARD, None):
+            break
+        guess_letters(game.guesses[-1], game.codes[-1])
+    if game.over:  # Saved just as it ended: finish it now rather than leave a board that takes no input
+        send_message("win" if game.won else "lose")
+        backspace_btn.configure(text="Reset", command=reset)
+        finish_game()  # Also clears the snapshot
+    return None if game.over else remaining
+
+
+# ------ Save the game before the window closes ------
+def close_window():
+    if game and not game.over:
+        save_game()
+    window.destroy()
 
 
 # ------------ Game play functions ------------
-# ------- Generate word list ------
+# ------- Generate word list on a background thread (cached on disk by wordlist.py) ------
+@traced
 def generate_wordlist():
-    remove_list = ['slave', 'schwa', 'polio', 'didst', 'anode', 'lathe', 'dikes', 'bosom', 'imply', 'rotor', 'urine',
-                   'nymph', 'asses', 'thine', 'sexes', 'daddy', 'emery', 'sunup', 'sloop', 'radii', 'booby', 'tepee',
-                   'outdo', 'ketch', 'copra', 'tapir', 'floes', 'kinks', 'franc', 'mamma', 'rondo', 'jambs', 'lyres',
-                   'conic', 'shalt', 'abbot', 'mikes', 'aster', 'cocci', 'umbra', 'voile', 'sulfa', 'civet', 'kinky',
-                   'rills', 'ovule', 'enrol', 'gauss', 'bayed', 'larch', 'mamas', 'phlox', 'ingot', 'flied', 'dells',
-                   'whelk', 'feted', 'cocos', 'sirup', 'laths', 'lodes', 'prows', 'etude', 'copse', 'boned', 'heres',
-                   'haves', 'hells', 'soled', 'aping', 'quaff', 'rajah', 'scull', 'lores', 'ameba', 'adzes', 'ivies',
-                   'papaw', 'jells', 'cruet', 'laxly', 'rends', 'loams', 'viler', 'lolls', 'diked', 'lowed', 'bests',
-                   'boner', 'avers', 'pares', 'kales', 'arced', 'acnes', 'neons', 'fiefs', 'dints', 'yules', 'lilts',
-                   'beefs', 'fells', 'lames', 'jawed', 'dupes', 'deads', 'noons', 'vireo', 'metes', 'sedge', 'papas',
-                   'wheys', 'hilts', 'beaus', 'gists', 'yogas', 'zeals', 'soots', 'cress', 'doffs', 'biers', 'suets',
-                   'hobos', 'lints', 'brans', 'teals', 'garbs', 'pewee', 'wends', 'banes', 'napes', 'pyres', 'bides',
-                   'veals', 'dirks', 'tippy', 'piths', 'whets', 'wools', 'dirts', 'jutes', 'hemps', 'okapi', 'dusks',
-                   'sears', 'novae', 'murks', 'slues', 'saris', 'dills', 'meany', 'bunts', 'razes', 'ruses', 'vends',
-                   'judos', 'pulps', 'mucks', 'vises', 'gotta', 'fugue', 'radix', 'cubit', 'versa', 'adieu', 'terns',
-                   'junta', 'alpha', 'prick', 'ephod', 'veldt', 'bream', 'rosin', 'bolls', 'doers', 'downs', 'humph',
-                   'fella', 'mould', 'beryl', 'brier', 'canst', 'quoth', 'lemme', 'tenon', 'deeps', 'padre', 'leant',
-                   'quipu', 'manna', 'duple', 'boron', 'revue', 'alack', 'inter', 'dilly', 'whist', 'spake', 'loess',
-                   'lingo', 'dunno', 'sissy', 'calyx', 'coons', 'piney', 'lemma', 'whirr', 'saith', 'ionic', 'harem',
-                   'dross', 'farad', 'jingo', 'bower', 'facto', 'toves', 'basal', 'yella', 'hymen', 'scrip', 'swash',
-                   'aleph', 'tinny', 'wanta', 'trice', 'garde', 'sower', 'penal', 'sonny', 'quirt', 'mebbe', 'xenon',
-                   'hullo', 'negro', 'hadst', 'aloes', 'quint', 'raped', 'salvo', 'hertz', 'xylem', 'cohos', 'sorta',
-                   'gamba', 'axial', 'aleck', 'siree', 'bandy', 'gunny', 'runic', 'whizz', 'ochre', 'edger', 'gimme',
-                   'theta', 'dykes', 'servo', 'telly', 'blocs', 'vitae', 'bronc', 'tabor', 'comer', 'borer', 'sired',
-                   'privy', 'mammy', 'deary', 'quire', 'thugs', 'anion', 'fagot', 'letup', 'eyrie', 'axons', 'umber',
-                   'miler', 'fibre', 'vitro', 'mater', 'umped', 'newel', 'treed', 'rangy', 'brads', 'mommy', 'motes',
-                   'imams', 'hallo', 'canto', 'idyll', 'laity', 'ducal', 'metre', 'unary', 'goeth', 'baler', 'sited',
-                   'hasps', 'brung', 'holed', 'swank', 'looky', 'loamy', 'pimps', 'shunt', 'seder', 'annas', 'coypu',
-                   'shims', 'zowie']  # List of words that may be inappropriate or too obscure
-    response = requests.get("https://www-cs-faculty.stanford.edu/~knuth/sgb-words.txt")
-    data = response.text
-    word_list = []
-    for line in data.split():
-        if len(line) == 5 and line not in remove_list:
-            word_list.append(line)
-    return word_list[:3417]  # Slices first half of list for most popular words
-
-
-# ------- Pick word of the day from word list ------
-def pick_word(words):
-    word = words[randint(0, len(words))]
-    return word
-
-
-# ------ Click button from keyboard input from user ------
-def button_click(key):
-    try:
-        if key == keyboard.Key.enter:
-            key = "enter"
-        elif key == keyboard.Key.backspace:
-            key = "backspace_btn"
-        else:
-            if key.char in list(ascii_lowercase):
-                key = key.char
-        globals()[key].invoke()
-    except AttributeError:  # if keyboard input not part of keyboard in GUI, input is ignored
-        pass
-    except KeyError:
-        pass
+    loader.start()
+    scheduler.add(check_wordlist)
+
+
+# ------ Runs on the loader thread: the Lexicon, plus the pattern table absurdle and multi-board games read ------
+def prepare_words(words):
+    if (ABSURDLE or BOARDS > 1) and load_pattern_table is not None:
+        load_pattern_table(words)  # Built once and cached on disk, so the game only maps it
+    return Lexicon(words)
+
+
+# ------ Check on the word list each scheduler tick; start the game once it is ready ------
+def check_wordlist(now):
+    global wordlist, hint_engine, lexicon
+    if loader.busy():
+        return
+    scheduler.remove(check_wordlist)
+    if loader.result is None:
+        send_message("offline")  # Pressing Enter tries again
+        return
+    startup["word_list"] = time.perf_counter() - STARTED
+    lexicon = loader.result
+    wordlist = lexicon.words
+    hint_engine = HintEngine(wordlist)
+    message_canvas.configure(height=10)
+    message_canvas.itemconfig(message, text="")
+    play()
+    if BOARDS == 1:
+        hint_engine.warm()  # Table for hints, loaded while the player makes the first guesses
 
 
-# ------- Check letters of guess against picked word ------
-def guess_letters(guess, wordle_word):
-    letter_list = []
-    for num in range(0, len(guess)):
-        if guess[num] in wordle_word:
-            if guess.count(guess[num]) <= wordle_word.count(guess[num]):
-                if guess[num] == wordle_word[num]:
-                    letter_list.append("green")
-                else:
-                    letter_list.append("yellow")
-            elif guess.count(guess[num]) > wordle_word.count(guess[num]):
-                guess_indices = [item for item in range(len(guess)) if guess[item] == guess[num]]
-                wordle_indices = [item for item in range(len(wordle)) if wordle[item] == guess[num]]
-                diff = [item for item in guess_indices if item not in wordle_indices]
-                if num in wordle_indices:
-                    letter_list.append("green")
-                elif len(guess_indices) - len(wordle_indices) > 1:
-                    if num == diff[-1] or num == diff[-2]:
-                        letter_list.append("gray")
-                    else:
-                        letter_list.append("yellow")
-                else:
-                    if num == diff[-1]:
-                        letter_list.append("gray")
-                    else:
-                        letter_list.append("yellow")
-        else:
-            letter_list.append("gray")
+# ------ First frame drawn with the mainloop running: the window takes input from here on ------
+def first_frame():
+    window.update_idletasks()
+    startup["first_frame"] = time.perf_counter() - STARTED
+
+
+# ------- Show how the letters of a checked guess matched the picked word ------
+@traced
+def guess_letters(guess, code):
+    letter_list = colors(code, game.length)  # code is the base-3 pattern from scoring.py
+    hint_engine.update(lexicon.indices_in(game.candidates))  # The answers the hint engine still considers
     update_letters(letter_list)  # Sends list of colors based on guess letters
     update_keyboard(list(guess), letter_list)  # Sends list of colors and list of guess letters
-    if letter_list.count("green") == 5:
-        return True
+    renderer.flush()  # Paints only the tiles and keys that changed
+    update_remaining()
+    return code == all_green(game.length)
 
 
-# # ------- Update UI colors of keyboard letters ------
-def update_keyboard(chars, colors):
-    global keys_used
-    for letter in chars:
-        if letter in keys_used.keys():  # once a key on the keyboard is green, it stays green
-            if keys_used[letter] == "yellow" and colors[chars.index(letter)] == "green":
-                keys_used.update({letter: colors[chars.index(letter)]})
-            elif keys_used[letter] == "gray" and colors[chars.index(letter)] != "gray":
-                keys_used.update({letter: colors[chars.index(letter)]})
-        else:
-            keys_used.update({letter: colors[chars.index(letter)]})
-    for char, color in keys_used.items():
-        if color == "green":
-            globals()[char].configure(bg=GREEN, fg=WHITE)
-        elif color == "yellow":
-            globals()[char].configure(bg=YELLOW, fg=WHITE)
+# ------- Show a guess on every board still being played, all painted in one flush ------
+@traced
+def guess_boards(guess, codes):
+    letter_list = []
+    keys = []
+    key_colors = []
+    for board, code in enumerate(codes):
+        if code is None:  # Solved earlier: the row stays blank
+            letter_list += [None] * game.length
         else:
-            globals()[char].configure(bg=DK_GRAY, fg=WHITE)
+            letter_list += colors(code, game.length)
+            keys += [(char, board) for char in guess]  # Keys are colored per board
+            key_colors += colors(code, game.length)
+    update_letters(letter_list)
+    update_keyboard(keys, key_colors)
+    renderer.flush()
+    update_remaining()
+
 
+# ------ Board columns showing letter num of the typed guess: one per board still being played ------
+def letter_columns(num):
+    if BOARDS == 1:
+        return [num]
+    boards = game.unsolved() if game else range(0, BOARDS)
+    return [board * COLUMNS + num for board in boards]
 
-# ------- Update UI colors of guessed letter tiles ------
+
+# ------- Update colors of keyboard letters (drawn on the next flush) ------
+@traced
+def update_keyboard(chars, colors):
+    board_model.merge_keys(chars, colors)  # once a key on the keyboard is green, it stays green
+
+
+# ------- Update colors of guessed letter tiles (drawn on the next flush) ------
+@traced
 def update_letters(char_color_list):
-    global letters_of_guess
-    global tries
-    for num in range(0, len(char_color_list)):
-        canvas_bg = globals()["canvas" + str(tries) + "_" + str(num + 1)]
-        word = globals()["word" + str(tries) + "_l" + str(num + 1)]
-        canvas_bg.itemconfig(word, fill=WHITE)
-        if char_color_list[num] == "green":
-            canvas_bg.configure(bg=GREEN)
-        elif char_color_list[num] == "yellow":
-            canvas_bg.configure(bg=YELLOW)
-        else:
-            canvas_bg.configure(bg=DK_GRAY)
-    letters_of_guess.clear()
+    board_model.set_colors(len(game.guesses) - 1, char_color_list)  # Row of the guess just checked
+
+
+# ------- Update count (and optionally list) of answers still possible ------
+def update_remaining():
+    if BOARDS > 1:
+        remaining_canvas.itemconfig(remaining_text, text=f"{game.remaining()} of {BOARDS} boards left")
+        return
+    count = game.remaining()  # Kept up to date by the game, one bitset intersection per guess
+    text = f"{count} possible word{'' if count == 1 else 's'} left"
+    if show_remaining:
+        shown = game.remaining_words(LIST_LIMIT)
+        text += "\n" + " ".join(word.upper() for word in shown) + (" ..." if count > len(shown) else "")
+    remaining_canvas.itemconfig(remaining_text, text=text)
+
+
+def toggle_remaining(event=None):
+    global show_remaining
+    show_remaining = not show_remaining
+    if game:
+        update_remaining()
 
 
 # ------- Update guessed letters in tiles (before checking if guess == wordle) ------
+@traced
 def select_letters(char):
-    global game_over
-    global tries
-    global letters_of_guess
-    if game_over is False and len(letters_of_guess) < 5:
-        letters_of_guess.append(char)
-        canvas = globals()["canvas" + str(tries) + "_" + str(len(letters_of_guess))]
-        word = globals()["word" + str(tries) + "_l" + str(len(letters_of_guess))]
-        canvas.itemconfig(word, text=char.upper())
+    if not game:  # Still loading: show the letter now, it is played once the game starts
+        if len(typed) < COLUMNS:
+            for column in letter_columns(len(typed)):
+                board_model.set_letter(0, column, char)
+            typed.append(char)
+            renderer.flush()
+        return
+    num = game.add_letter(char)
+    if num is not None:
+        for column in letter_columns(num):
+            board_model.set_letter(game.tries - 1, column, char)
+        renderer.flush()
 
 
 # ------- Delete letters from UI ------
+@traced
 def backspace():
-    global tries
-    global letters_of_guess
-    if not game_over and len(letters_of_guess) > 0:
-        canvas = globals()["canvas" + str(tries) + "_" + str(len(letters_of_guess))]
-        word = globals()["word" + str(tries) + "_l" + str(len(letters_of_guess))]
-        canvas.itemconfig(word, text="")
-        letters_of_guess.pop()
+    if not game:
+        if typed:
+            typed.pop()
+            for column in letter_columns(len(typed)):
+                board_model.set_letter(0, column, "")
+            renderer.flush()
+        return
+    num = game.remove_letter()
+    if num is not None:
+        for column in letter_columns(num):
+            board_model.set_letter(game.tries - 1, column, "")
+        renderer.flush()
 
 
 # ------ Send messages to user ------
-def send_message(code):
-    global wordle
+def send_message(code, word=""):
     message_canvas.configure(width=400, height=44)
     if code == "win":
         message_canvas.itemconfig(message, text="You win!")
-    if code == "lose":
-        message_canvas.itemconfig(message, text=f"You lose! The word is {wordle.upper()}.")
+    if code == "lose" and BOARDS > 1:
+        missed = ", ".join(game.answers[board].upper() for board in game.unsolved())
+        message_canvas.itemconfig(message, text=f"You lose! You missed {missed}.")
+    elif code == "lose":
+        message_canvas.itemconfig(message, text=f"You lose! The word is {game.answer.upper()}.")
     if code == "not":
         message_canvas.itemconfig(message, text="Not in word list!")
+    if code == "hard":
+        message_canvas.itemconfig(message, text="Hard mode: use the revealed hints!")
+    if code == "thinking":
+        message_canvas.itemconfig(message, text="Finding a hint...")
+    if code == "hint":
+        message_canvas.itemconfig(message, text=f"Try {word.upper()}!")
+    if code == "loading":
+        message_canvas.itemconfig(message, text="Loading word list...")
+    if code == "offline":
+        message_canvas.itemconfig(message, text="Couldn't load the word list. Press Enter to retry.")
+
+
+# ------ Ask for a hint; the scan runs in worker processes (see hints.py) ------
+def request_hint():
+    if BOARDS == 1 and game and not game.over and not hint_engine.busy():
+        send_message("thinking")
+        hint_engine.start(game.hard_mode)  # Hard mode would reject a hint that is not a candidate
+        scheduler.add(check_hint)
+
+
+# ------ Check on the hint scan each scheduler tick without blocking the mainloop ------
+def check_hint(now):
+    word = hint_engine.poll()
+    if not hint_engine.busy():
+        scheduler.remove(check_hint)
+        if word and not game.over:
+            send_message("hint", word)
 
 
 # ------ Submit guess for checking and update number of tries ------
-def submit_guess(guess):
-    guess = ''.join(guess)
-    global game_over, tries, wordle, wordlist
-    if not game_over:
-        if guess in wordlist and tries < 7:
-            message_canvas.configure(width=200, height=10)
-            win = guess_letters(guess, wordle)
-            reset_timer()
-            if win:
-                send_message("win")  # send message to user that they won
-                backspace_btn.configure(text="Reset", command=reset)
-                game_over = True
-            elif tries == 6:
-                send_message("lose")  # send message to user that they lost
-                backspace_btn.configure(text="Reset", command=reset)
-                game_over = True
-            else:
-                start_timer()
-            tries += 1
-        else:
-            if guess:
-                send_message("not")  # send message to player that guess is not in word list
+@traced
+def submit_guess(guess=None):
+    global enter_queued
+    if not game:  # Held until the word list is ready; retries the download if it failed
+        enter_queued = True
+        if not loader.busy() and loader.result is None:
+            generate_wordlist()
+        send_message("loading")
+        return
+    enter_queued = False
+    if game.over:
+        return
+    if clock.expired():  # Deadline passed before this guess was handled: the timer wins
+        time_up()
+        return
+    entered = guess or game.letters
+    used = TIME_LIMIT - clock.remaining()
+    result = game.submit(guess)  # Checks the typed letters unless a guess is given
+    if result == NOT_WORD:
+        if entered:
+            send_message("not")  # send message to player that guess is not in word list
+        return
+    if result == NOT_HARD:
+        send_message("hard")  # send message to player that guess ignores a revealed hint
+        return
+    message_canvas.configure(width=200, height=10)
+    guess_times.append(round(used, 2))
+    if BOARDS > 1:
+        guess_boards(game.guesses[-1], game.codes[-1])  # Scored on every board in one call
+    else:
+        guess_letters(game.guesses[-1], game.codes[-1])
+    reset_timer()
+    if result == WIN:
+        send_message("win")  # send message to user that they won
+        backspace_btn.configure(text="Reset", command=reset)
+        finish_game()
+    elif result == LOSE:
+        send_message("lose")  # send message to user that they lost
+        backspace_btn.configure(text="Reset", command=reset)
+        finish_game()
+    else:
+        start_timer()
+        save_game()
+
+
+# ------ Stats panel; reads counters kept up to date per game, never the whole log ------
+def show_stats():
+    summary = stats_log.summary()
+    panel = Toplevel(window, padx=30, pady=20, bg=WHITE)
+    panel.title("Statistics")
+    Label(panel, text="Statistics", font=WORD_FONT, bg=WHITE).grid(column=0, row=0, columnspan=2)
+    lines = [("Played", summary["games"]), ("Win %", f"{summary['win_rate']:.0%}"),
+             ("Current streak", summary["streak"]), ("Max streak", summary["max_streak"]),
+             ("Ran out of time", summary["timeouts"]),
+             ("Time per guess", f"{summary['seconds_per_guess']:.1f} s")]
+    for num, (name, value) in enumerate(lines, start=1):
+        Label(panel, text=name, font=BUTTON_FONT, bg=WHITE).grid(column=0, row=num, sticky="w")
+        Label(panel, text=value, font=BUTTON_FONT, bg=WHITE).grid(column=1, row=num, sticky="e")
+    chart = Canvas(panel, width=260, height=24 * len(summary["distribution"]) + 30, bg=WHITE, highlightthickness=0)
+    chart.create_text(130, 12, text="Guess distribution", font=BUTTON_FONT)
+    most = max(summary["distribution"]) or 1
+    for num, count in enumerate(summary["distribution"]):
+        y = 30 + 24 * num
+        chart.create_text(10, y + 10, text=str(num + 1), font=BUTTON_FONT)
+        chart.create_rectangle(24, y, 24 + 20 + 200 * count / most, y + 20, fill=DK_GRAY, outline="")
+        chart.create_text(30, y + 10, text=str(count), font=BUTTON_FONT, fill=WHITE, anchor="w")
+    chart.grid(column=0, row=len(lines) + 1, columnspan=2, pady=10)
 
 
 # ------ Reset for new game ------
+@traced
 def reset():
-    global tries, game_over, wordle, letters_of_guess, keys_used
-    letters_of_guess.clear()
-    keys_used.clear()
-    tries = 1
-    wordle = ""
-    game_over = False
-    for x_num in range(1, 7):
-        canvas = "canvas" + str(x_num)
-        word = "word" + str(x_num)
-        for y_num in range(1, 6):
-            bg = globals()[canvas + "_" + str(y_num)]
-            letter = globals()[word + "_l" + str(y_num)]
-            bg.configure(bg=WHITE)
-            bg.itemconfig(letter, fill=BLACK, text="")
+    hint_engine.reset()
+    guess_times.clear()
+    game.reset()  # Picks a new word
+    board_model.clear()
+    renderer.flush()  # Repaints only the tiles and keys that were used
     message_canvas.configure(height=10)
     message_canvas.itemconfig(message, text="")
     backspace_btn.configure(text="⌫", command=backspace)
-    for char in list(ascii_lowercase):
-        globals()[char].configure(bg=LT_GRAY, fg=BLACK)
     reset_timer()
     play()
 
@@ -298,106 +464,24 @@ def reset():
 # ---------------------------- UI setup ------------------------------- #
 window = Tk()
 window.title("Wordle")
+window.protocol("WM_DELETE_WINDOW", close_window)
+stats_log = StatsLog()
+store = GameStore(log=stats_log, snapshot=snapshot_name())
 window.config(padx=100, pady=50, bg=WHITE)
 
 title_label = Label(text="Wordle", font=(FONT_NAME, 40, "bold"), bg=WHITE, fg=BLACK)
 title_label.grid(column=0, row=0, columnspan=12)
 
 
-# ------ First guess ------
-frame1 = Tier(kwargs={"row": 1})
-
-canvas1_1 = Tile(frame1, kwargs={"column": 0, "row": 0, "properties": TILE_PROPS})
-word1_l1 = canvas1_1.letter
-canvas1_2 = Tile(frame1, kwargs={"column": 1, "row": 0, "properties": TILE_PROPS})
-word1_l2 = canvas1_2.letter
-canvas1_3 = Tile(frame1, kwargs={"column": 2, "row": 0, "properties": TILE_PROPS})
-word1_l3 = canvas1_3.letter
-canvas1_4 = Tile(frame1, kwargs={"column": 3, "row": 0, "properties": TILE_PROPS})
-word1_l4 = canvas1_4.letter
-canvas1_5 = Tile(frame1, kwargs={"column": 4, "row": 0, "properties": TILE_PROPS})
-word1_l5 = canvas1_5.letter
-
-
-# ------ Second guess ------
-frame2 = Tier(kwargs={"row": 2})
-
-canvas2_1 = Tile(frame2, kwargs={"column": 0, "row": 0, "properties": TILE_PROPS})
-word2_l1 = canvas2_1.letter
-canvas2_2 = Tile(frame2, kwargs={"column": 1, "row": 0, "properties": TILE_PROPS})
-word2_l2 = canvas2_2.letter
-canvas2_3 = Tile(frame2, kwargs={"column": 2, "row": 0, "properties": TILE_PROPS})
-word2_l3 = canvas2_3.letter
-canvas2_4 = Tile(frame2, kwargs={"column": 3, "row": 0, "properties": TILE_PROPS})
-word2_l4 = canvas2_4.letter
-canvas2_5 = Tile(frame2, kwargs={"column": 4, "row": 0, "properties": TILE_PROPS})
-word2_l5 = canvas2_5.letter
-
-
-# ------ Third guess ------
-frame3 = Tier(kwargs={"row": 3})
-
-canvas3_1 = Tile(frame3, kwargs={"column": 0, "row": 0, "properties": TILE_PROPS})
-word3_l1 = canvas3_1.letter
-canvas3_2 = Tile(frame3, kwargs={"column": 1, "row": 0, "properties": TILE_PROPS})
-word3_l2 = canvas3_2.letter
-canvas3_3 = Tile(frame3, kwargs={"column": 2, "row": 0, "properties": TILE_PROPS})
-word3_l3 = canvas3_3.letter
-canvas3_4 = Tile(frame3, kwargs={"column": 3, "row": 0, "properties": TILE_PROPS})
-word3_l4 = canvas3_4.letter
-canvas3_5 = Tile(frame3, kwargs={"column": 4, "row": 0, "properties": TILE_PROPS})
-word3_l5 = canvas3_5.letter
-
-
-# ------ Fourth guess ------
-frame4 = Tier(kwargs={"row": 4})
-
-canvas4_1 = Tile(frame4, kwargs={"column": 0, "row": 0, "properties": TILE_PROPS})
-word4_l1 = canvas4_1.letter
-canvas4_2 = Tile(frame4, kwargs={"column": 1, "row": 0, "properties": TILE_PROPS})
-word4_l2 = canvas4_2.letter
-canvas4_3 = Tile(frame4, kwargs={"column": 2, "row": 0, "properties": TILE_PROPS})
-word4_l3 = canvas4_3.letter
-canvas4_4 = Tile(frame4, kwargs={"column": 3, "row": 0, "properties": TILE_PROPS})
-word4_l4 = canvas4_4.letter
-canvas4_5 = Tile(frame4, kwargs={"column": 4, "row": 0, "properties": TILE_PROPS})
-word4_l5 = canvas4_5.letter
-
-
-# ------ Fifth guess ------
-frame5 = Tier(kwargs={"row": 5})
-
-canvas5_1 = Tile(frame5, kwargs={"column": 0, "row": 0, "properties": TILE_PROPS})
-word5_l1 = canvas5_1.letter
-canvas5_2 = Tile(frame5, kwargs={"column": 1, "row": 0, "properties": TILE_PROPS})
-word5_l2 = canvas5_2.letter
-canvas5_3 = Tile(frame5, kwargs={"column": 2, "row": 0, "properties": TILE_PROPS})
-word5_l3 = canvas5_3.letter
-canvas5_4 = Tile(frame5, kwargs={"column": 3, "row": 0, "properties": TILE_PROPS})
-word5_l4 = canvas5_4.letter
-canvas5_5 = Tile(frame5, kwargs={"column": 4, "row": 0, "properties": TILE_PROPS})
-word5_l5 = canvas5_5.letter
-
-
-# ------ Sixth guess ------
-frame6 = Tier(kwargs={"row": 6})
-
-canvas6_1 = Tile(frame6, kwargs={"column": 0, "row": 0, "properties": TILE_PROPS})
-word6_l1 = canvas1_1.letter
-canvas6_2 = Tile(frame6, kwargs={"column": 1, "row": 0, "properties": TILE_PROPS})
-word6_l2 = canvas1_2.letter
-canvas6_3 = Tile(frame6, kwargs={"column": 2, "row": 0, "properties": TILE_PROPS})
-word6_l3 = canvas1_3.letter
-canvas6_4 = Tile(frame6, kwargs={"column": 3, "row": 0, "properties": TILE_PROPS})
-word6_l4 = canvas1_4.letter
-canvas6_5 = Tile(frame6, kwargs={"column": 4, "row": 0, "properties": TILE_PROPS})
-word6_l5 = canvas1_5.letter
+# ------ Guess tiles, all drawn on one canvas ------
+board_view = CanvasBoard(kwargs={"rows": ROWS, "columns": COLUMNS, "row": 1, "boards": BOARDS, "across": min(BOARDS, 4),
+                                 "properties": BOARD_PROPS if BOARDS == 1 else MULTI_BOARD_PROPS})
 
 
 # ------ Extra padding frame/user messages ------
 frame7 = Tier(kwargs={"row": 7})
 message_canvas = Canvas(frame7, width=200, height=10, bg=WHITE, highlightthickness=0)
-message = message_canvas.create_text(200, 24, text="", font=WORD_FONT)
+message = message_canvas.create_text(200, 24, text="", font=WORD_FONT, width=390, justify="center")
 message_canvas.grid(column=0, row=0, columnspan=12)
 
 
@@ -448,6 +532,8 @@ k = LetterKey(frame9, kwargs={"text": "K", "column": 7, "properties": BUTTON_PRO
               partial(select_letters, "k")})
 l = LetterKey(frame9, kwargs={"text": "L", "column": 8, "properties": BUTTON_PROPS, "command":
               partial(select_letters, "l")})
+stats_btn = LetterKey(frame9, kwargs={"text": "Stats", "column": 9, "properties": BUTTON_PROPS, "command": show_stats})
+stats_btn.configure(width=5)
 
 
 # ------ Keyboard row 3 ------
@@ -467,11 +553,12 @@ n = LetterKey(frame10, kwargs={"text": "N", "column": 6, "properties": BUTTON_PR
               partial(select_letters, "n")})
 m = LetterKey(frame10, kwargs={"text": "M", "column": 7, "properties": BUTTON_PROPS, "command":
               partial(select_letters, "m")})
-enter = LetterKey(frame10, kwargs={"text": "Enter", "column": 0, "properties": BUTTON_PROPS, "command":
-                  partial(submit_guess, letters_of_guess)})
+enter = LetterKey(frame10, kwargs={"text": "Enter", "column": 0, "properties": BUTTON_PROPS, "command": submit_guess})
 enter.configure(width=6)
 backspace_btn = LetterKey(frame10, kwargs={"text": "⌫", "column": 8, "properties": BUTTON_PROPS, "command": backspace})
 backspace_btn.configure(width=6)
+hint_btn = LetterKey(frame10, kwargs={"text": "Hint", "column": 9, "properties": BUTTON_PROPS, "command": request_hint})
+hint_btn.configure(width=5)
 
 
 # ------ Timer text UI ------
@@ -479,24 +566,81 @@ frame11 = Tier(kwargs={"row": 11})
 timer_canvas = Canvas(frame11, width=400, height=44, bg=WHITE, highlightthickness=0)
 timer_text = timer_canvas.create_text(200, 24, text="Timer: 45 seconds", font=WORD_FONT)
 timer_canvas.grid(column=0, row=0, columnspan=12)
-
-
-# ------ Initiate keyboard listener ------
-listener = keyboard.Listener(on_release=button_click)
-listener.start()
-
-
-# ------- Initiate game play -------
+scheduler = Scheduler(window, TICK)  # Drives the timer text and any other periodic UI work (see scheduler.py)
+scheduler.add(countdown)
+
+
+# ------ Remaining words text UI (click to list them) ------
+frame12 = Tier(kwargs={"row": 12})
+remaining_canvas = Canvas(frame12, width=400, height=64, bg=WHITE, highlightthickness=0)
+remaining_text = remaining_canvas.create_text(200, 32, text="", font=BUTTON_FONT, width=390, justify="center")
+remaining_canvas.grid(column=0, row=0, columnspan=12)
+remaining_canvas.bind("<Button-1>", toggle_remaining)
+
+
+# ------ Board model and renderer (see board.py) ------
+board_model = BoardModel(rows=ROWS, columns=COLUMNS * BOARDS)
+key_items = {char: globals()[char] for char in ascii_lowercase}
+if BOARDS > 1:  # Letter keys show one color per board, so they are drawn on a canvas instead of buttons
+    for key in key_items.values():
+        key.grid_remove()
+    hint_btn.grid_remove()
+    keyboard = CanvasKeyboard(frame8, kwargs={"boards": BOARDS, "command": select_letters,
+                                              "properties": KEYBOARD_PROPS})
+    key_items = keyboard.segments  # (letter, board) -> KeySegment
+animator = Animator(scheduler, board_view, COLUMNS)  # Frames run as a task on the one scheduler
+if ANIMATE:  # The renderer paints through the animator, which holds key colors until a row has flipped
+    key_items = {key: animator.key(item) for key, item in key_items.items()}
+renderer = BoardRenderer(board_model, animator if ANIMATE else board_view, key_items,
+                         {"green": GREEN, "yellow": YELLOW, "gray": DK_GRAY},
+                         blank=WHITE, ink=BLACK, light_ink=WHITE, key_blank=LT_GRAY)
+
+
+# ------ Keyboard input, read through Tk while the window has focus (see dispatcher.py) ------
+key_handlers = {char: partial(select_letters, char) for char in ascii_lowercase}
+key_handlers.update({"enter": enter.invoke, "backspace": backspace_btn.invoke, "hint": hint_btn.invoke})
+dispatcher = InputDispatcher(window, key_handlers)
+
+
+# ------- New game for the mode picked on the command line -------
+def make_game():
+    if BOARDS > 1:
+        return MultiGame(lexicon, BOARDS, ROWS)
+    return (AdversarialGame if ABSURDLE else Game)(lexicon, ROWS, HARD_MODE)
+
+
+# ------- Initiate game play (the timer starts only once the word is picked) -------
+@traced
 def play():
-    global game_over, wordlist, wordle, letters_of_guess, tries
-    if not game_over:
-        if not wordlist:
-            wordlist = generate_wordlist()
-        if not wordle:
-            wordle = pick_word(wordlist)
-        start_timer()
-#    print(wordle)  # For testing
-
-
-play()
+    global game
+    remaining = None
+    if not game:
+        for num in range(len(typed)):  # Letters typed while loading are played into the game below
+            for column in letter_columns(num):
+                board_model.set_letter(0, column, "")
+        game = make_game()  # Picks the word of the day
+        remaining = restore_game()  # Resumes a game that was closed or crashed, if there is one
+        for char in typed:
+            select_letters(char)
+        typed.clear()
+        animator.finish()  # A resumed game appears as it was left, without replaying its reveals
+    update_remaining()
+    if not game.over:
+        start_timer(remaining)
+        save_game()
+        if enter_queued:
+            submit_guess()
+#    print(game.answer)  # For testing
+
+loader = WordlistLoader(COLUMNS, prepare_words)  # The window is usable while the list loads (see wordlist.py)
+generate_wordlist()
+window.after_idle(first_frame)
 window.mainloop()
+if hint_engine:
+    hint_engine.close()
+store.close()  # Writes anything still queued
+if "--latency" in sys.argv:
+    print("Startup (s):", {name: round(seconds, 3) for name, seconds in startup.items()})
+    print("Input-to-paint latency (ms):", dispatcher.stats())
+    print("Scheduler tick lateness (ms):", scheduler.stats())
+    print("Animation frames:", animator.stats())
@@ -0,0 +1,57 @@
+from collections import Counter
+from game import Game
+from scoring import score
+try:
+    import numpy as np
+    from pattern_table import load_pattern_table, load_pattern_rows
+except ImportError:  # NumPy is optional; without it candidates are bucketed with scoring.py directly
+    np = None
+    load_pattern_table = load_pattern_rows = None
+
+'''absurdle.py is an adversarial Wordle mode in the style of Absurdle: the answer is not picked in advance. Every guess
+splits the answers still possible into groups by the feedback pattern they would give, and the game keeps the largest
+group, so the player has to corner it. The split is one row of the pattern table counted with np.bincount, which
+takes well under a millisecond even for the first guess over the whole list, so it runs on the Tk thread. Lists too
+long for a table (6-8 letters) score that one row on demand with NumPy instead, in tens of milliseconds. Without
+NumPy the remaining answers are scored and counted instead.'''
+
+
+# ------ Largest group of candidates by feedback pattern; returns (pattern, mask of the candidates kept) ------
+def partition(table, guess, candidates, patterns):
+    row = table[guess, candidates]
+    counts = np.bincount(row, minlength=patterns)
+    code = int(counts.argmax())  # Ties go to the lowest pattern, so the all-green one only wins when it must
+    return code, row == code
+
+
+def partition_words(guess, words):
+    counts = Counter(score(guess, word) for word in words)
+    return min(counts, key=lambda code: (-counts[code], code))
+
+
+class AdversarialGame(Game):
+    __slots__ = ("table", "indices")
+    mode = "absurdle"
+
+    def __init__(self, lexicon, max_tries=6, hard_mode=False):
+        self.table = load_pattern_rows(lexicon.words) if load_pattern_rows is not None else None
+        self.indices = None
+        super().__init__(lexicon, max_tries, hard_mode)
+
+    # ------ There is no answer to pick: the one shown is any word still possible until guesses narrow the list ------
+    def reset(self, answer=None):
+        if answer is not None:  # Replaying the guesses (as restore and replay do) rebuilds the game without one
+            raise ValueError("an adversarial game does not take an answer")
+        super().reset()
+        if self.table is not None:
+            self.indices = np.arange(len(self.lexicon.words))
+
+    def _feedback(self, guess):
+        if self.table is not None:
+            code, kept = partition(self.table, self.lexicon.index[guess], self.indices, 3 ** self.length)
+            self.indices = self.indices[kept]
+            self.answer = self.lexicon.words[self.indices[0]]
+        else:
+            code = partition_words(guess, self.lexicon.words_in(self.candidates))
+            self.answer = self.lexicon.words_in(self.lexicon.consistent(guess, code, self.candidates), 1)[0]
+        return code
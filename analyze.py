@@ -0,0 +1,159 @@
+import os
+import sys
+import json
+import math
+import time
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from scoring import score
+from hints import table_entropies, entropy
+from strategies import FirstCandidate, Entropy
+from stats import valid_record
+from wordlist import load_wordlist, WORD_LENGTH, LENGTHS
+
+'''analyze.py replays played games (the JSON lines written by stats.py) and measures each guess: how many answers were
+still possible before and after it, how many bits of information it gained, how many it was expected to gain, and how
+many guesses the entropy solver from strategies.py would have needed from the same position. The greedy entropy solver
+stands in for optimal play, since an exact optimum is far too costly to run per position. Feedback comes from
+scoring.py and candidates are narrowed the way the simulator's strategies do it (one pattern-table lookup per guess
+when NumPy is installed), so the rules are the game's own.
+
+The log is read lazily, sent to a process pool in chunks with only a few chunks in flight, and results are written
+as JSON lines as soon as they are ready, so memory stays flat however long the log is. Lines that are not a game
+record (corrupted, or torn by a crash) get {"line": n, "error": "unreadable line"} and the run goes on. Example:
+
+    python analyze.py data/games.log analysis.jsonl --workers 4'''
+
+
+# ------ Constants ------
+MEMO_LIMIT = 200000  # Solver positions remembered per worker before the memo is cleared
+
+
+# ------ Worker process state ------
+_replay = None
+_solver = None
+_solved = {}
+
+
+def _init_worker(words):
+    global _replay, _solver
+    _replay = FirstCandidate(words)
+    _solver = Entropy(words)
+
+
+# ------ Guesses the solver needs to finish from a position (None if it would run past the sixth guess) ------
+def solver_guesses(history, answer, max_tries):
+    key = (tuple(history), answer)
+    if key not in _solved:
+        if len(_solver.memo) > MEMO_LIMIT:
+            _solver.memo.clear()
+            _solved.clear()
+        _solver.reset()
+        for guess, code in history:
+            _solver.update(guess, code)
+        needed = None
+        for num in range(len(history), max_tries):
+            guess = _solver.guess()
+            if guess == answer:
+                needed = num - len(history) + 1
+                break
+            _solver.update(guess, score(guess, answer))
+        _solved[key] = needed
+    return _solved[key]
+
+
+# ------ Expected information (bits) of a guess over the answers still possible ------
+def expected_bits(guess, candidates):
+    if len(candidates) <= 1:
+        return 0.0
+    if _replay.table is not None:
+        return float(table_entropies(_replay.table, [guess], candidates, _solver.patterns)[0])
+    return entropy(_replay.words, guess, candidates)
+
+
+# ------ Analyze one played game ------
+def analyze_game(record, max_tries=6):
+    answer, guesses = record["answer"], record["guesses"]
+    if answer not in _replay.index or any(guess not in _replay.index for guess in guesses):
+        return {"answer": answer, "guesses": guesses, "error": "word not in the word list"}
+    _replay.reset()
+    history = []
+    steps = []
+    for guess in guesses:
+        before = len(_replay.candidates)
+        bits = expected_bits(_replay.index[guess], _replay.candidates)
+        code = score(guess, answer)
+        _replay.update(guess, code)
+        after = len(_replay.candidates)
+        steps.append({"guess": guess, "before": before, "after": after,
+                      "bits": round(math.log2(before / after), 3), "expected_bits": round(bits, 3),
+                      "solver_guesses": solver_guesses(history, answer, max_tries)})
+        history.append((guess, code))
+    return {"answer": answer, "guesses": guesses, "won": record.get("won"), "steps": steps}
+
+
+# ------ Analyze numbered log lines, skipping the ones stats.py would skip too ------
+def analyze_chunk(lines):
+    results = []
+    for number, line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if valid_record(record) and isinstance(record.get("answer"), str):
+            results.append(json.dumps(analyze_game(record)) + "\n")
+        else:
+            results.append(json.dumps({"line": number, "error": "unreadable line"}) + "\n")
+    return results
+
+
+# ------ Read the log lazily, a chunk of (line number, line) at a time ------
+def read_chunks(path, size):
+    chunk = []
+    with open(path, errors="replace") as file:
+        for number, line in enumerate(file, start=1):
+            if line.strip():
+                chunk.append((number, line))
+                if len(chunk) == size:
+                    yield chunk
+                    chunk = []
+    if chunk:
+        yield chunk
+
+
+def write_results(output, results, counts):
+    output.writelines(results)
+    unreadable = sum(1 for result in results if result.startswith('{"line"'))
+    counts["unreadable"] += unreadable
+    counts["games"] += len(results) - unreadable
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare played Wordle games with the entropy solver.")
+    parser.add_argument("log", help="game log written by stats.py (JSON lines)")
+    parser.add_argument("output", help="where to write one JSON line of analysis per game")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk", type=int, default=500, help="games per task sent to a worker")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH, choices=LENGTHS, help="letters per word played")
+    args = parser.parse_args()
+
+    words = load_wordlist(args.length)
+    counts = {"games": 0, "unreadable": 0}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(args.workers, initializer=_init_worker, initargs=(words,)) as pool, \
+            open(args.output, "w") as output:
+        pending = deque()
+        for chunk in read_chunks(args.log, args.chunk):
+            pending.append(pool.submit(analyze_chunk, chunk))
+            if len(pending) >= args.workers * 2:  # Keep only a few chunks in flight
+                write_results(output, pending.popleft().result(), counts)
+        while pending:
+            write_results(output, pending.popleft().result(), counts)
+    elapsed = time.perf_counter() - start
+    print(f"Analyzed {counts['games']} games in {elapsed:.1f} s ({counts['games'] / elapsed:,.0f} games/sec); "
+          f"{counts['unreadable']} unreadable lines skipped", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import math
+import time
+
+'''animation.py plays the NYT-style reveal: the tiles of a checked row flip one after another and take their colors
+halfway through, typed letters pop, and the keyboard takes its new colors once the row has landed. An Animator stands
+in for the board view that BoardRenderer paints (see board.py), so the model and renderer do not change. Every
+animation runs from one frame task on the app's Scheduler (see scheduler.py), added at 60 frames a second while
+anything is moving and removed once everything is still; each frame works out where every animation should be from
+the monotonic clock, so frames the mainloop was too busy for are skipped (and counted) rather than played late, and
+Tk is only touched for tiles that are moving. Input is never blocked: letters for the next guess are typed while a row
+is still flipping, and a row submitted during a reveal starts flipping when the previous one is done.'''
+
+
+# ------ Constants ------
+FRAME = 1 / 60  # Seconds per frame
+FLIP = 0.3  # Seconds one tile takes to flip
+STAGGER = 0.12  # Seconds between the flips of neighbouring tiles
+POP = 0.1  # Seconds a typed letter's pop takes
+POP_SCALE = 0.12  # How much larger a tile grows at the top of a pop
+
+
+class Animator:
+    def __init__(self, scheduler, board, columns):
+        self.scheduler = scheduler
+        self.board = board  # CanvasBoard
+        self.columns = columns  # Letters per word; flips are staggered by position within each board
+        self.moving = {}  # (row, column) -> [kind, start, duration, colors or None]
+        self.held_keys = []  # (when, key, bg, fg): colors waiting for their row to land
+        self.reveal_end = 0.0  # When the last queued flip finishes
+        self.row = None  # Row being revealed, and when its first tile starts flipping
+        self.row_start = 0.0
+        self.played = 0
+
+    # ------------ Board view interface, called by BoardRenderer.flush() ------------
+    def set_letter(self, row, column, text):
+        self.board.set_letter(row, column, text)
+        if text and (row, column) not in self.moving:
+            self._start((row, column), ["pop", time.monotonic(), POP, None])
+
+    # ------ Queue a flip; the colors go on when the tile is edge-on ------
+    def set_colors(self, row, column, text, bg, fg):
+        if row != self.row:  # A new row waits for the one before it to land; every board of a row flips together
+            self.row = row
+            self.row_start = max(time.monotonic(), self.reveal_end)
+        start = self.row_start + STAGGER * (column % self.columns)
+        self.reveal_end = max(self.reveal_end, start + FLIP)
+        self.board.set_letter(row, column, text)
+        if (row, column) in self.moving:  # A pop still playing: back to size while the tile waits for its flip
+            self.board.scale_tile(row, column, 1, 1)
+        self._start((row, column), ["flip", start, FLIP, (text, bg, fg)])
+
+    def clear(self):
+        for row, column in self.moving:
+            self.board.scale_tile(row, column, 1, 1)
+        self.moving.clear()
+        self._release_keys()
+        self.reveal_end = 0.0
+        self.row = None
+        self._idle()
+        self.board.clear()
+
+    # ------ Keys the renderer colors are held until the row being revealed has landed ------
+    def key(self, widget):
+        return HeldKey(self, widget)
+
+    def configure_key(self, widget, bg, fg):
+        if time.monotonic() < self.reveal_end:
+            self.held_keys.append((self.reveal_end, widget, bg, fg))
+        else:
+            widget.configure(bg=bg, fg=fg)
+
+    # ------------ Frame loop ------------
+    def _start(self, cell, animation):
+        self.moving[cell] = animation
+        if self.frame not in self.scheduler.tasks:
+            self.scheduler.add(self.frame, FRAME)
+
+    def frame(self, now):
+        self.played += 1
+        for cell, (kind, start, duration, colors) in list(self.moving.items()):
+            progress = (now - start) / duration
+            if progress < 0:  # Staggered flip that has not started yet
+                continue
+            if progress >= 1:
+                if colors:
+                    self.board.set_colors(*cell, *colors)  # In case the frame at the halfway point was skipped
+                self.board.scale_tile(*cell, 1, 1)
+                del self.moving[cell]
+            elif kind == "flip":
+                if progress >= 0.5 and colors:
+                    self.board.set_colors(*cell, *colors)
+                    self.moving[cell][3] = None
+                self.board.scale_tile(*cell, 1, abs(math.cos(math.pi * progress)))
+            else:
+                scale = 1 + POP_SCALE * math.sin(math.pi * progress)
+                self.board.scale_tile(*cell, scale, scale)
+        self._release_keys(now)
+        if not self.moving and not self.held_keys:
+            self._idle()
+
+    def _release_keys(self, now=None):
+        held = []
+        for when, widget, bg, fg in self.held_keys:
+            if now is None or now >= when:
+                widget.configure(bg=bg, fg=fg)
+            else:
+                held.append((when, widget, bg, fg))
+        self.held_keys = held
+
+    def _idle(self):
+        self.scheduler.remove(self.frame)
+
+    # ------ Jump every animation to its end (e.g. after replaying a saved game) ------
+    def finish(self):
+        self.frame(max(self.reveal_end, time.monotonic()) + FLIP)
+        self.reveal_end = 0.0
+        self.row = None
+
+    # ------ Frames played and frames dropped because the mainloop was busy ------
+    def stats(self):
+        return {"frames": self.played, "dropped": self.scheduler.skipped.get(self.frame, 0)}
+
+
+# ------ Stands in for a keyboard key so its color change waits for the reveal ------
+class HeldKey:
+    def __init__(self, animator, widget):
+        self.animator = animator
+        self.widget = widget
+
+    def configure(self, bg, fg=None):
+        self.animator.configure_key(self.widget, bg, fg)
@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+import argparse
+from statistics import median
+from tkinter import Tk
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tiles import TileGrid, CanvasBoard
+
+'''bench_board.py compares the cold-start and reset time of the original board (one Tile widget per letter) with the
+single-canvas board from tiles.py. It needs a display; on a headless machine run it under a virtual one, e.g.
+
+    xvfb-run python benchmarks/bench_board.py --rows 6 --columns 5'''
+
+
+# ------ Constants ------
+FONT = ("Arial", 14, "bold")
+TILE_PROPS = {"x": 24, "y": 24, "text": "", "font": FONT, "bg": "#FFFFFF", "ink": "#000000"}
+BOARD_PROPS = {"size": 48, "gap": 4, "font": FONT, "bg": "#FFFFFF", "outline": "#D7DBDD", "ink": "#000000"}
+BOARDS = {"tile widgets": (TileGrid, TILE_PROPS), "single canvas": (CanvasBoard, BOARD_PROPS)}
+
+
+# ------ Build, fill and reset one board; returns (build seconds, reset seconds) ------
+def time_board(board_class, properties, rows, columns):
+    window = Tk()
+    start = time.perf_counter()
+    board = board_class(kwargs={"rows": rows, "columns": columns, "row": 1, "properties": properties})
+    window.update()  # Include mapping and the first paint
+    build = time.perf_counter() - start
+    for row in range(0, rows):
+        for column in range(0, columns):
+            board.set_colors(row, column, "W", "#67BD1B", "#FFFFFF")
+    window.update()
+    start = time.perf_counter()
+    board.clear()
+    window.update()
+    reset = time.perf_counter() - start
+    window.destroy()
+    return build, reset
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare board build and reset latency.")
+    parser.add_argument("--rows", type=int, default=6)
+    parser.add_argument("--columns", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    for name, (board_class, properties) in BOARDS.items():
+        times = [time_board(board_class, properties, args.rows, args.columns) for _ in range(0, args.repeats)]
+        print(f"{name:>14}: build {median(t[0] for t in times) * 1000:7.2f} ms, "
+              f"reset {median(t[1] for t in times) * 1000:7.2f} ms (median of {args.repeats})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import os
+import sys
+import json
+import time
+import runpy
+import random
+import argparse
+from tkinter import Tk
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # The app imports its modules
+
+'''bench_ui.py runs the real Wordle window and times it: building the whole UI up to the first paint, a six-guess game
+typed letter by letter, and reset(). The app's mainloop is swapped for the scripted run, which then closes the
+window, so nothing else in the app changes. It needs a display; suite.py starts it under xvfb-run when there is none,
+with the word list and saved games in temporary folders. Prints one JSON line of seconds (fastest of --repeats).'''
+
+
+# ------ Constants ------
+APP_PATH = os.path.join(sys.path[0], "Wordle_FinalProject.py")
+LOAD_TIMEOUT = 30  # Seconds to wait for the word list
+
+
+# ------ Drain pending events and paint ------
+def settle(window):
+    window.update()
+
+
+# ------ Type and submit guesses through the app's own handlers; returns seconds ------
+def play_game(app, window, guesses):
+    start = time.perf_counter()
+    for guess in guesses:
+        for char in guess:
+            app.select_letters(char)
+        app.submit_guess()
+        window.update_idletasks()
+    return time.perf_counter() - start
+
+
+def scripted(window, started, repeats, results):
+    app = sys.modules["__main__"]  # The app's globals while runpy is running it
+    settle(window)
+    results["ui.build"] = time.perf_counter() - started
+    deadline = time.monotonic() + LOAD_TIMEOUT
+    while app.game is None:
+        if time.monotonic() > deadline:
+            raise RuntimeError("word list did not load")
+        settle(window)
+        time.sleep(0.005)
+    rng = random.Random(6)
+    games = []
+    resets = []
+    for _ in range(0, repeats):
+        guesses = rng.sample([word for word in app.wordlist if word != app.game.answer], 6)  # Lost in six
+        games.append(play_game(app, window, guesses))
+        settle(window)
+        start = time.perf_counter()
+        app.reset()
+        window.update_idletasks()
+        resets.append(time.perf_counter() - start)
+        settle(window)
+    results["ui.six_guesses"] = min(games)
+    results["ui.reset"] = min(resets)
+    window.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the Wordle window under a display.")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    results = {}
+    started = time.perf_counter()
+    Tk.mainloop = lambda window, n=0: scripted(window, started, args.repeats, results)
+    sys.argv = [APP_PATH]
+    runpy.run_path(APP_PATH, run_name="__main__")
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+import os
+import sys
+import json
+import time
+import random
+import statistics
+import shutil
+import argparse
+import tempfile
+import threading
+import subprocess
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+'''suite.py times the paths that decide how the game feels and compares them with a recorded baseline:
+
+    scoring.*     scoring.py over guess x answer pairs (guess_letters' colors), with and without repeated letters,
+                  and the vectorized pattern table
+    wordlist.*    generate_wordlist's work: filtering the raw list, a full download from a local fixture server
+                  (no network is used) and reading the disk cache
+    membership.*  the word-list check in submit_guess, through the Lexicon and through Game.submit
+    ui.*          building the whole window, a six-guess game and reset(), via bench_ui.py under a virtual X display
+                  (xvfb-run) when there is no display; skipped if neither is available, failed if bench_ui.py fails
+
+Every case is timed in --rounds rounds, interleaved so a slow spell on the machine hits all cases alike; a round takes
+the fastest of --repeats runs and the median round counts. A case slower than its baseline by more than --threshold
+(50% by default: medians still moved by up to 42% between runs on a shared VM) fails the run, and so does a case with
+no baseline to compare with. Baselines depend on the machine, so record them on the one you measure with:
+
+    python benchmarks/suite.py --record
+    python benchmarks/suite.py'''
+
+
+# ------ Constants ------
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(HERE, "baseline.json")
+FIXTURE_WORDS = 20000  # Lines in the generated word-list fixture
+FIXTURE_SEED = 2024
+SAMPLE = 300  # Words per side of the scoring cases (SAMPLE x SAMPLE pairs)
+LOOPS = 40  # Passes per run of the millisecond-scale cases, so they are long enough (~100 ms) to time steadily
+
+sys.path.insert(0, os.path.dirname(HERE))
+os.environ["WORDLE_CACHE_DIR"] = tempfile.mkdtemp(prefix="wordle-bench-cache-")  # Before the project is imported
+os.environ["WORDLE_DATA_DIR"] = tempfile.mkdtemp(prefix="wordle-bench-data-")
+import wordlist
+from lexicon import Lexicon
+from game import Game
+from scoring import score
+try:
+    from pattern_table import pattern_matrix
+except ImportError:  # NumPy not installed: the table case is skipped
+    pattern_matrix = None
+
+
+# ------------ Word-list fixture, served over local HTTP ------------
+# ------ Deterministic stand-in for the downloaded list: mixed lengths, repeated letters, removed words ------
+def fixture_text():
+    rng = random.Random(FIXTURE_SEED)
+    letters = "eeeaaarrriioottnnsslcudpmhgbfywkvxzjq"
+    lines = [rng.choice(sorted(wordlist.REMOVE_LIST)) if num % 50 == 0 else
+             "".join(rng.choice(letters) for _ in range(rng.choice((3, 4, 5, 5, 5, 6, 7))))
+             for num in range(0, FIXTURE_WORDS)]
+    return "\n".join(lines) + "\n"
+
+
+def start_fixture_server(text):
+    body = text.encode("ascii")
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/words.txt"
+
+
+# ------------ Cases: each returns a function to time ------------
+def scoring_pairs(words):
+    sample = words[:SAMPLE]
+    return lambda: [score(guess, answer) for guess in sample for answer in sample]
+
+
+def scoring_duplicates(words):
+    sample = [word for word in words if len(set(word)) < len(word)][:SAMPLE]
+    return lambda: [score(guess, answer) for guess in sample for answer in sample]
+
+
+def scoring_table(words):
+    return lambda: pattern_matrix(words)
+
+
+def wordlist_filter(text):
+    return lambda: [wordlist.filter_words(text) for _ in range(0, LOOPS)]
+
+
+def wordlist_fetch():
+    return lambda: [wordlist.fetch_wordlist() for _ in range(0, LOOPS)]
+
+
+def wordlist_read_cache():
+    return lambda: [wordlist.read_cache() for _ in range(0, LOOPS)]
+
+
+def membership_lexicon(lexicon, probes):
+    return lambda: [probe in lexicon for _ in range(0, LOOPS) for probe in probes]
+
+
+def membership_submit(lexicon, probes):
+    game = Game(lexicon)
+    misses = [probe for probe in probes if probe not in lexicon]
+    return lambda: [game.submit(probe) for _ in range(0, LOOPS) for probe in misses]  # Rejected: game unchanged
+
+
+# ------ Fastest of repeats, in seconds ------
+def best_time(function, repeats):
+    times = []
+    for _ in range(0, repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+# ------ UI cases in a child process, under xvfb-run when there is no display ------
+# ------ Returns {case: seconds}, None if there is no display to use, or the error text if the child failed ------
+def run_ui(url, repeats):
+    command = [sys.executable, os.path.join(HERE, "bench_ui.py"), "--repeats", str(repeats)]
+    if not os.environ.get("DISPLAY"):
+        if not shutil.which("xvfb-run"):
+            return None
+        command = ["xvfb-run", "-a"] + command
+    environment = dict(os.environ, WORDLE_WORDS_URL=url)
+    process = subprocess.run(command, env=environment, capture_output=True, text=True)
+    try:
+        return json.loads(process.stdout.splitlines()[-1])
+    except (IndexError, ValueError):
+        return (process.stderr.strip().splitlines() or [f"exit status {process.returncode}"])[-1]
+
+
+# ------ Median over rounds of each case's fastest run; returns (results, names of cases that could not run) ------
+def run_cases(repeats, rounds, ui):
+    text = fixture_text()
+    server, url = start_fixture_server(text)
+    wordlist.WORDS_URL = url
+    wordlist.fetch_wordlist()  # Leaves the cache the other cases read
+    words = wordlist.read_cache()
+    lexicon = Lexicon(words)
+    rng = random.Random(FIXTURE_SEED)
+    probes = [rng.choice(words) if num % 2 else "".join(rng.sample(rng.choice(words), len(words[0])))
+              for num in range(0, 20000)]  # Half words, half shuffled letters (mostly not words)
+    cases = {"wordlist.fetch": wordlist_fetch(),
+             "wordlist.filter": wordlist_filter(text),
+             "wordlist.read_cache": wordlist_read_cache(),
+             "scoring.pairs": scoring_pairs(words),
+             "scoring.duplicates": scoring_duplicates(words),
+             "membership.lexicon": membership_lexicon(lexicon, probes),
+             "membership.submit": membership_submit(lexicon, probes)}
+    if pattern_matrix is not None:
+        cases["scoring.table"] = scoring_table(words)
+    times = {name: [] for name in cases}
+    failed = []
+    for _ in range(0, rounds):
+        for name, function in cases.items():
+            times[name].append(best_time(function, repeats))
+        if ui:
+            ui_results = run_ui(url, repeats)
+            if ui_results is None:
+                print("ui.*: skipped (no display and no xvfb-run)")
+                ui = False
+            elif isinstance(ui_results, str):
+                print(f"ui.*: FAILED ({ui_results})")
+                failed.append("ui.*")
+                ui = False
+            else:
+                for name, seconds in ui_results.items():
+                    times.setdefault(name, []).append(seconds)
+    server.shutdown()
+    return {name: statistics.median(samples) for name, samples in times.items()}, failed
+
+
+# ------ Print results next to the baseline; returns the names of regressed cases and of cases with no baseline ------
+def compare(results, baseline, threshold):
+    regressed = []
+    print(f"{'case':<22}{'ms':>10}{'baseline':>10}{'change':>9}")
+    for name, seconds in results.items():
+        if name in baseline:
+            change = seconds / baseline[name] - 1
+            flag = " REGRESSED" if change > threshold else ""
+            print(f"{name:<22}{seconds * 1000:>10.2f}{baseline[name] * 1000:>10.2f}{change:>+9.1%}{flag}")
+            if flag:
+                regressed.append(name)
+        else:
+            print(f"{name:<22}{seconds * 1000:>10.2f}{'-':>10}{'-':>9} NO BASELINE")
+            regressed.append(name)
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Wordle hot paths against a recorded baseline.")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per case and round; the fastest counts")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds per case; the median round counts")
+    parser.add_argument("--threshold", type=float, default=0.5, help="allowed slowdown before a case fails")
+    parser.add_argument("--record", action="store_true", help="save these results as the new baseline")
+    parser.add_argument("--no-ui", action="store_true", help="skip the cases that need a display")
+    args = parser.parse_args()
+
+    results, failed = run_cases(args.repeats, args.rounds, not args.no_ui)
+    try:
+        with open(BASELINE_PATH) as file:
+            baseline = json.load(file)
+    except (OSError, ValueError):
+        baseline = {}
+    regressed = compare(results, baseline, args.threshold) + failed
+    if args.record and not failed:
+        baseline.update(results)  # Cases not run this time (e.g. --no-ui) keep their recorded baseline
+        with open(BASELINE_PATH, "w") as file:
+            json.dump({name: round(seconds, 6) for name, seconds in baseline.items()}, file, indent=2)
+            file.write("\n")
+        print(f"Baseline saved to {BASELINE_PATH}")
+    elif regressed:
+        print(f"{len(regressed)} case(s) failed, had no baseline or were slower than baseline by more than "
+              f"{args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+from tracing import traced
+
+'''board.py keeps what the Wordle board and keyboard should show (letters and colors) in a BoardModel, apart from the
+Tk widgets. The model remembers which tiles and keys changed; a BoardRenderer then pushes just those changes to Tk in
+one pass, so a guess costs a few Tcl calls for the tiles and keys it touched instead of reconfiguring everything. The
+tiles are drawn by a board view from tiles.py (CanvasBoard, or the older TileGrid of widgets) with set_letter(),
+set_colors() and clear().'''
+
+
+# ------ Constants ------
+KEY_PRIORITY = {None: 0, "gray": 1, "yellow": 2, "green": 3}  # A key only ever moves up, e.g. green stays green
+
+
+class BoardModel:
+    def __init__(self, rows=6, columns=5):
+        self.rows = rows
+        self.columns = columns
+        self.cells = [[("", None)] * columns for _ in range(0, rows)]  # (letter, color name or None)
+        self.keys = {}  # letter -> best color seen so far
+        self.dirty_cells = set()
+        self.dirty_keys = set()
+        self.cleared = False
+
+    # ------ Type or delete a letter ------
+    def set_letter(self, row, column, letter):
+        color = self.cells[row][column][1]
+        if self.cells[row][column] != (letter, color):
+            self.cells[row][column] = (letter, color)
+            self.dirty_cells.add((row, column))
+
+    # ------ Color a checked row ------
+    def set_colors(self, row, colors):
+        for column, color in enumerate(colors):
+            letter = self.cells[row][column][0]
+            if self.cells[row][column] != (letter, color):
+                self.cells[row][column] = (letter, color)
+                self.dirty_cells.add((row, column))
+
+    # ------ Merge the colors of a guess into the keyboard, letter by letter ------
+    def merge_keys(self, chars, colors):
+        for letter, color in zip(chars, colors):
+            if KEY_PRIORITY[color] > KEY_PRIORITY[self.keys.get(letter)]:
+                self.keys[letter] = color
+                self.dirty_keys.add(letter)
+
+    # ------ Blank board and keyboard ------
+    def clear(self):
+        for row in range(0, self.rows):
+            for column in range(0, self.columns):
+                if self.cells[row][column] != ("", None):
+                    self.cells[row][column] = ("", None)
+                    self.dirty_cells.add((row, column))
+        self.dirty_keys.update(self.keys)
+        self.keys.clear()
+        self.cleared = True
+
+    # ------ Changes since the last call, as (cleared, [(row, column, letter, color)], [(letter, color)]) ------
+    def take_changes(self):
+        cells = [(row, column) + self.cells[row][column] for row, column in sorted(self.dirty_cells)]
+        keys = [(letter, self.keys.get(letter)) for letter in sorted(self.dirty_keys)]
+        cleared = self.cleared
+        self.dirty_cells.clear()
+        self.dirty_keys.clear()
+        self.cleared = False
+        return cleared, cells, keys
+
+
+class BoardRenderer:
+    def __init__(self, model, view, keys, palette, blank, ink, light_ink, key_blank):
+        self.model = model
+        self.view = view  # CanvasBoard or TileGrid
+        self.keys = keys  # letter -> LetterKey
+        self.palette = palette  # color name -> hex
+        self.blank = blank
+        self.ink = ink
+        self.light_ink = light_ink
+        self.key_blank = key_blank
+        self.painted = {}  # (row, column) -> (letter, color) currently on screen
+
+    # ------ Push pending model changes to Tk ------
+    @traced
+    def flush(self):
+        cleared, cells, keys = self.model.take_changes()
+        if cleared:
+            self.view.clear()  # Blanks the whole board at once; only cells typed since then are painted below
+            self.painted.clear()
+        for row, column, letter, color in cells:
+            old_letter, old_color = self.painted.get((row, column), ("", None))
+            if color != old_color:
+                self.view.set_colors(row, column, letter.upper(), self.palette.get(color, self.blank),
+                                     self.light_ink if color else self.ink)
+            elif letter != old_letter:
+                self.view.set_letter(row, column, letter.upper())
+            self.painted[(row, column)] = (letter, color)
+        for letter, color in keys:
+            if color:
+                self.keys[letter].configure(bg=self.palette[color], fg=self.light_ink)
+            else:
+                self.keys[letter].configure(bg=self.key_blank, fg=self.ink)
+        return len(cells) + len(keys)
@@ -0,0 +1,75 @@
+import sys
+import time
+from collections import deque
+from string import ascii_lowercase
+from tracing import ENABLED, tracer, section
+
+'''dispatcher.py turns key presses in the Wordle window into game input. Keys are bound through Tk, so they are only
+read while the window has focus and always arrive on the main thread. Each press is put on one queue together with
+the time it was read; the queue is drained on the main loop, every key in it is handled, and the screen is painted
+once. The time from each press to that paint is recorded so typing speed can be checked. A handler that raises is
+reported through Tk and the remaining keys are still handled, so one failure cannot stop the keyboard.'''
+
+
+# ------ Constants ------
+SPECIAL_KEYS = {"Return": "enter", "KP_Enter": "enter", "BackSpace": "backspace", "Tab": "hint"}
+LATENCY_SAMPLES = 1000  # Most recent presses kept for latency stats
+
+
+class InputDispatcher:
+    def __init__(self, window, handlers):
+        self.window = window
+        self.handlers = handlers  # key name ("a" ... "z", "enter", "backspace", "hint") -> function
+        self.queue = deque()
+        self.draining = False
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        window.bind("<KeyPress>", self.on_key)
+
+    # ------ Tk key binding: queue the key and return "break" so Tab does not move focus ------
+    def on_key(self, event):
+        if event.keysym in SPECIAL_KEYS:
+            self.post(SPECIAL_KEYS[event.keysym])
+        elif event.char and event.char.lower() in ascii_lowercase:
+            self.post(event.char.lower())
+        else:
+            return None
+        return "break"
+
+    # ------ Queue input from any source ------
+    def post(self, key):
+        self.queue.append((key, time.perf_counter()))
+        if not self.draining:
+            self.draining = True
+            self.window.after_idle(self.drain)
+
+    # ------ Handle all queued keys, then paint once ------
+    def drain(self):
+        handled = []
+        try:
+            while self.queue:
+                key, pressed = self.queue.popleft()
+                if ENABLED:  # Time the key spent queued before it was handled
+                    tracer.record("InputDispatcher.queue", round(pressed * 1e9), time.perf_counter_ns())
+                if key in self.handlers:
+                    try:
+                        self.handlers[key]()
+                    except Exception:
+                        self.window.report_callback_exception(*sys.exc_info())  # Prints it, as for any Tk callback
+                    handled.append(pressed)
+        finally:
+            self.draining = False  # Otherwise post() would never schedule another drain
+        if handled:
+            with section("InputDispatcher.paint"):
+                self.window.update_idletasks()  # Paint now so the latency below covers the redraw
+            painted = time.perf_counter()
+            self.latencies.extend(painted - pressed for pressed in handled)
+
+    # ------ Input-to-paint latency, in milliseconds ------
+    def stats(self):
+        samples = sorted(self.latencies)
+        if not samples:
+            return {"keys": 0}
+        return {"keys": len(samples),
+                "p50": samples[len(samples) // 2] * 1000,
+                "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+                "max": samples[-1] * 1000}
@@ -0,0 +1,112 @@
+import random
+from scoring import score, all_green
+from tracing import traced
+
+'''game.py holds the rules of one Wordle game with no Tk code, so a game can be played without a display. The UI in
+Wordle_FinalProject.py keeps a Game and draws whatever it reports; simulate.py drives many of them directly. Games
+share one read-only Lexicon (see lexicon.py) for checking guesses. Each game also keeps the answers still consistent
+with its feedback as a Lexicon bitset, narrowed by one intersection per guess; in hard mode a guess has to be one of
+them.'''
+
+
+# ------ Results of submitting a guess ------
+NOT_WORD = "not"
+NOT_HARD = "hard"
+WIN = "win"
+LOSE = "lose"
+CONTINUE = "continue"
+
+
+class Game:
+    __slots__ = ("lexicon", "hard_mode", "length", "max_tries", "letters", "answer", "tries", "guesses", "codes",
+                 "candidates", "over", "won")  # Keeps per-game memory small when a server holds thousands
+    mode = "classic"  # Saved in snapshots (see snapshot.py) so a game is only resumed in the mode it was played in
+
+    def __init__(self, lexicon, max_tries=6, hard_mode=False):
+        self.lexicon = lexicon
+        self.hard_mode = hard_mode
+        self.length = lexicon.length
+        self.max_tries = max_tries
+        self.letters = []
+        self.reset()
+
+    # ------ Start a new game, with a random answer unless one is given ------
+    def reset(self, answer=None):
+        self.answer = answer or random.choice(self.lexicon.words)
+        self.tries = 1
+        self.letters.clear()  # Cleared in place; the UI keeps a reference to this list
+        self.guesses = []
+        self.codes = []
+        self.candidates = self.lexicon.all
+        self.over = False
+        self.won = False
+
+    # ------ Type a letter; returns its position or None if the row is full ------
+    def add_letter(self, char):
+        if self.over or len(self.letters) >= self.length:
+            return None
+        self.letters.append(char)
+        return len(self.letters) - 1
+
+    # ------ Delete the last letter; returns its position or None if the row is empty ------
+    def remove_letter(self):
+        if self.over or not self.letters:
+            return None
+        self.letters.pop()
+        return len(self.letters)
+
+    # ------ Check a guess (the typed letters by default) and move to the next row ------
+    @traced
+    def submit(self, guess=None):
+        if self.over:
+            return None
+        if guess is None:
+            guess = "".join(self.letters)
+        if guess not in self.lexicon:  # Hashed lookup
+            return NOT_WORD
+        if self.hard_mode and not self.lexicon.allows(guess, self.candidates):  # Ignores a revealed hint
+            return NOT_HARD
+        code = self._feedback(guess)
+        self.guesses.append(guess)
+        self.codes.append(code)
+        self.candidates = self.lexicon.consistent(guess, code, self.candidates)
+        self.letters.clear()
+        if code == all_green(self.length):
+            self.over = self.won = True
+            result = WIN
+        elif self.tries == self.max_tries:
+            self.over = True
+            result = LOSE
+        else:
+            result = CONTINUE
+        self.tries += 1
+        return result
+
+    # ------ Pattern for a checked guess; AdversarialGame (see absurdle.py) picks the answer here instead ------
+    def _feedback(self, guess):
+        return score(guess, self.answer)
+
+    # ------ Answers still possible ------
+    def remaining(self):
+        return self.lexicon.count(self.candidates)
+
+    def remaining_words(self, limit=None):
+        return self.lexicon.words_in(self.candidates, limit)
+
+    # ------ Timer ran out ------
+    def expire(self):
+        if self.over:
+            return False
+        self.over = True
+        return True
+
+    # ------ Play a whole game with a strategy (see simulate.py); returns guesses used, or None if lost ------
+    def play(self, strategy, answer=None):
+        self.reset(answer)
+        strategy.reset()
+        while not self.over:
+            guess = strategy.guess()
+            if self.submit(guess) == NOT_WORD:
+                raise ValueError(f"strategy guessed a word that is not in the word list: {guess}")
+            strategy.update(guess, self.codes[-1])
+        return len(self.guesses) if self.won else None
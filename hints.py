@@ -0,0 +1,176 @@
+import os
+import math
+import threading
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from scoring import score
+try:
+    import numpy as np
+    from pattern_table import load_pattern_table, load_pattern_rows, TABLE_LIMIT
+except ImportError:  # NumPy is optional; without it hints are ranked with scoring.py directly
+    np = None
+    load_pattern_table = load_pattern_rows = None
+    TABLE_LIMIT = 0
+
+'''hints.py suggests the guess with the highest expected information gain (the entropy of the feedback patterns it
+would produce over the answers still possible). The scan over guesses x remaining answers runs in a pool of worker
+processes so the Tk mainloop keeps running; the UI starts a scan with HintEngine.start() and checks on it with
+HintEngine.poll() from window.after. HintEngine.warm() loads the pattern table on a background thread once the game
+is playing; a hint asked for before it is there waits for it in poll() instead of building it on the Tk thread. After
+each guess the engine is handed the Game's remaining answers rather than rescoring them on the Tk thread. Workers read
+feedback from the pattern table when NumPy is installed and the list is short enough to have one; otherwise they score
+pairs directly (with NumPy, a pattern_table.PatternRows), ranking at most SAMPLE_LIMIT of the remaining candidates
+against as many of them, so the scan stays short even for long lists of other word lengths. Each guess narrows the
+candidate list, so every later scan is cheaper than the one before.'''
+
+
+# ------ Constants ------
+SAMPLE_LIMIT = 1000  # Candidates scanned (as guesses and as answers) when there is no pattern table
+
+
+# ------ Worker process state ------
+_words = []
+_table = None
+
+
+def _init_worker(words):
+    global _words, _table
+    _words = words
+    if load_pattern_rows is not None:
+        _table = load_pattern_rows(words)  # Rows scored on demand for lists too long for a table
+
+
+# ------ Expected information (bits) of each guess over the given answers, from a pattern table ------
+def table_entropies(table, guesses, answers, patterns):
+    rows = np.asarray(table[np.ix_(guesses, answers)], dtype=np.int64)
+    rows += patterns * np.arange(len(guesses))[:, None]
+    counts = np.bincount(rows.ravel(), minlength=patterns * len(guesses))
+    if len(answers) < patterns:  # Few answers: sum log2 of each answer's bucket size instead of over every pattern
+        bits = math.log2(len(answers)) - np.log2(counts[rows]).sum(axis=1) / len(answers)
+    else:
+        probs = counts.reshape(len(guesses), patterns) / len(answers)
+        bits = -(probs * np.log2(np.where(probs > 0, probs, 1))).sum(axis=1)
+    return bits.round(12)  # Equal splits compare equal whichever way they were summed
+
+
+# ------ Expected information (bits) of one guess, scoring each answer directly ------
+def entropy(words, guess, answers):
+    counts = Counter(score(words[guess], words[answer]) for answer in answers)
+    return -sum(count / len(answers) * math.log2(count / len(answers)) for count in counts.values())
+
+
+# ------ Evenly spaced selection of at most limit items ------
+def spread(items, limit):
+    return items[::math.ceil(len(items) / limit)] if len(items) > limit else items
+
+
+# ------ Best guess of a chunk, as (bits, is candidate, guess index) ------
+def rank_chunk(guesses, answers):
+    candidates = set(answers)
+    if _table is not None:
+        bits = table_entropies(_table, guesses, answers, 3 ** len(_words[0])).tolist()
+    else:
+        bits = [entropy(_words, guess, answers) for guess in guesses]
+    return max(zip(bits, [guess in candidates for guess in guesses], guesses))
+
+
+class HintEngine:
+    def __init__(self, words, workers=None):
+        self.words = words
+        self.index = {word: num for num, word in enumerate(words)}
+        self.workers = workers or os.cpu_count() or 1
+        self.use_table = load_pattern_table is not None and len(words) <= TABLE_LIMIT
+        self.candidates = list(range(len(words)))
+        self.opening = None  # Best first guess never changes for a word list, so it is kept once found
+        self.generation = 0
+        self.pending = None
+        self.hard = False
+        self.pool = None
+        self.warming = None  # Thread loading the pattern table ahead of the first hint
+
+    # ------ Load (or build, on a cold cache) the pattern table in the background ------
+    def warm(self):
+        if self.use_table and self.warming is None:
+            self.warming = threading.Thread(target=load_pattern_table, args=(self.words,), daemon=True)
+            self.warming.start()
+
+    def ready(self):
+        return self.warming is None or not self.warming.is_alive()
+
+    # ------ Start the worker pool on first use; the table is loaded here first so forked workers share it ------
+    def _start_pool(self):
+        if self.use_table:
+            load_pattern_table(self.words)  # Memoized (normally by warm()), so no worker builds its own copy
+        if "fork" in multiprocessing.get_all_start_methods():
+            self.pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("fork"),
+                                            initializer=_init_worker, initargs=(self.words,))
+        else:  # Spawned workers would re-run the Tk script, so fall back to threads
+            self.pool = ThreadPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.words,))
+
+    # ------ Take the answers still possible (word indices), already narrowed by the Game's bitset ------
+    def update(self, candidates):
+        self.candidates = candidates
+        self.generation += 1
+
+    def reset(self):
+        self.candidates = list(range(len(self.words)))
+        self.generation += 1
+
+    def busy(self):
+        return self.pending is not None
+
+    # ------ Start a background scan; in hard mode only words still possible may be suggested ------
+    def start(self, hard=False):
+        if self.pending is not None:
+            return
+        self.hard = hard
+        if not self.ready():  # Table still loading: poll() starts the scan once it is there
+            self.pending = (self.generation, None)
+            return
+        if len(self.candidates) <= 2 or (self.opening is not None and len(self.candidates) == len(self.words)):
+            self.pending = (self.generation, [])
+            return
+        if self.pool is None:
+            self._start_pool()
+        if self.use_table:
+            guesses, answers = self.candidates if hard else list(range(len(self.words))), self.candidates
+        else:
+            guesses = answers = spread(self.candidates, SAMPLE_LIMIT)
+        size = max(1, math.ceil(len(guesses) / (self.workers * 4)))
+        futures = [self.pool.submit(rank_chunk, guesses[start:start + size], answers)
+                   for start in range(0, len(guesses), size)]
+        self.pending = (self.generation, futures)
+
+    # ------ Best guess once the scan is done (None while still running, if the board changed or a worker failed) ------
+    def poll(self):
+        if self.pending is None:
+            return None
+        generation, futures = self.pending
+        if futures is None:
+            if self.ready():
+                self.pending = None
+                self.start(self.hard)
+            return None
+        if not all(future.done() for future in futures):
+            return None
+        self.pending = None
+        if generation != self.generation:
+            return None
+        if not futures:
+            if len(self.candidates) <= 2:
+                return self.words[self.candidates[0]] if self.candidates else None
+            return self.opening
+        try:
+            best = max(future.result() for future in futures)
+        except Exception:  # E.g. a worker was killed; the next start() brings up a fresh pool
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+            return None
+        if len(self.candidates) == len(self.words):
+            self.opening = self.words[best[2]]
+        return self.words[best[2]]
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,98 @@
+from functools import lru_cache
+from scoring import decode, GREEN, GRAY
+from wordlist import load_wordlist, WORD_LENGTH
+
+'''lexicon.py wraps the word list in a Lexicon: a dict for constant-time membership and word indices, plus bitset
+indexes (Python ints, bit i standing for word i) of which words have each letter at each position and which have at
+least n copies of each letter. With those, the words that would give a certain feedback to a guess (and so are still
+possible answers) are found with a handful of bitwise operations instead of rescanning the list. lexicon_for() builds
+the Lexicon of a word length the first time that length is asked for and keeps it, so unused lengths cost nothing.'''
+
+
+class Lexicon:
+    def __init__(self, words):
+        self.words = list(words)
+        self.length = len(self.words[0])
+        self.index = {word: num for num, word in enumerate(self.words)}
+        self.all = (1 << len(self.words)) - 1
+        self.positions = [{} for _ in range(0, self.length)]  # positions[num][letter]: letter at position num
+        self.counts = {}  # counts[letter][n - 1]: at least n copies of letter
+        for num, word in enumerate(self.words):
+            bit = 1 << num
+            for pos, letter in enumerate(word):
+                self.positions[pos][letter] = self.positions[pos].get(letter, 0) | bit
+                copies = word.count(letter)
+                if word.index(letter) == pos:  # Count each letter once per word
+                    counts = self.counts.setdefault(letter, [0] * self.length)
+                    for n in range(0, copies):
+                        counts[n] |= bit
+
+    def __contains__(self, word):
+        return word in self.index
+
+    def __len__(self):
+        return len(self.words)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    # ------ Words with at least n copies of a letter ------
+    def at_least(self, letter, n):
+        if n == 0:
+            return self.all
+        if n > self.length or letter not in self.counts:
+            return 0
+        return self.counts[letter][n - 1]
+
+    # ------ Words that would give this feedback code to the guess, out of mask (all words by default) ------
+    def consistent(self, guess, code, mask=None):
+        mask = self.all if mask is None else mask
+        found = {}  # Green or yellow copies of each letter: the answer has at least that many
+        capped = set()  # Letters with a gray copy: the answer has exactly as many as found
+        for num, digit in enumerate(decode(code, self.length)):
+            letter = guess[num]
+            at_position = self.positions[num].get(letter, 0)
+            if digit == GREEN:
+                mask &= at_position
+            else:
+                mask &= ~at_position
+            if digit == GRAY:
+                capped.add(letter)
+            else:
+                found[letter] = found.get(letter, 0) + 1
+        for letter, n in found.items():
+            mask &= self.at_least(letter, n)
+        for letter in capped:
+            mask &= ~self.at_least(letter, found.get(letter, 0) + 1)
+        return mask
+
+    # ------ Read a bitset ------
+    def allows(self, word, mask):
+        return word in self.index and mask >> self.index[word] & 1 == 1
+
+    def count(self, mask):
+        return mask.bit_count()
+
+    # ------ Word indices in a bitset, read from its binary digits rather than one bit operation per word ------
+    def indices_in(self, mask):
+        bits = bin(mask)[:1:-1]  # Lowest bit first
+        found = []
+        num = bits.find("1")
+        while num != -1:
+            found.append(num)
+            num = bits.find("1", num + 1)
+        return found
+
+    def words_in(self, mask, limit=None):
+        found = []
+        while mask and (limit is None or len(found) < limit):
+            low = mask & -mask
+            found.append(self.words[low.bit_length() - 1])
+            mask ^= low
+        return found
+
+
+# ------ Lexicon of one word length, loaded and indexed on first use ------
+@lru_cache(maxsize=None)
+def lexicon_for(length=WORD_LENGTH):
+    return Lexicon(load_wordlist(length))
@@ -0,0 +1,115 @@
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from functools import lru_cache
+from wordlist import load_wordlist
+
+'''loadtest.py plays many games against server.py at once and reports per-guess latency. Each simulated player keeps
+one keep-alive connection and plays random guesses from the word list of the length the server reports until its
+game ends; guesses the server rejects (e.g. on a --hard server) are counted, and a game still going after
+MAX_ATTEMPTS guesses is abandoned. --hold opens extra idle games first, to check latency while the server holds
+thousands of sessions. The run fails (exit status 1) when the 99th percentile guess latency is above --p99-target-ms.
+Example:
+
+    python server.py &
+    python loadtest.py --clients 200 --games 20 --hold 5000'''
+
+
+# ------ Constants ------
+MAX_ATTEMPTS = 200  # Guesses, accepted or not, before a game is abandoned
+
+
+# ------ One HTTP request on an open keep-alive connection ------
+async def request(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: wordle\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+# ------ Word list of a length, loaded the first time a game of that length starts ------
+@lru_cache(maxsize=None)
+def words_for(length):
+    return load_wordlist(length)
+
+
+async def player(host, port, games, latencies, counts):
+    reader, writer = await asyncio.open_connection(host, port)
+    for _ in range(0, games):
+        status, game = await request(reader, writer, "POST", "/games")
+        if status != 201:
+            raise RuntimeError(f"could not start a game: {game}")
+        words = words_for(game["length"])
+        for _ in range(0, MAX_ATTEMPTS):
+            start = time.perf_counter()
+            status, state = await request(reader, writer, "POST", f"/games/{game['id']}/guess",
+                                          {"guess": random.choice(words)})
+            latencies.append(time.perf_counter() - start)
+            if status == 400:  # Not in the list or, in hard mode, ignores a hint: the game goes on
+                counts["rejected"] += 1
+            elif status != 200:
+                raise RuntimeError(f"guess failed with status {status}: {state}")
+            elif state["over"]:
+                break
+        else:
+            counts["abandoned"] += 1
+    writer.close()
+
+
+async def hold(host, port, count):
+    reader, writer = await asyncio.open_connection(host, port)
+    for _ in range(0, count):
+        await request(reader, writer, "POST", "/games")
+    writer.close()
+
+
+def percentile(samples, fraction):
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+async def run(args):
+    if args.hold:
+        await hold(args.host, args.port, args.hold)
+    latencies = []
+    counts = {"rejected": 0, "abandoned": 0}
+    start = time.perf_counter()
+    await asyncio.gather(*[player(args.host, args.port, args.games, latencies, counts)
+                           for _ in range(0, args.clients)])
+    elapsed = time.perf_counter() - start
+    samples = sorted(latencies)
+    p99 = percentile(samples, 0.99) * 1000
+    print(f"{args.clients * args.games} games, {len(samples)} guesses in {elapsed:.2f} s "
+          f"({len(samples) / elapsed:,.0f} guesses/sec) with {args.hold} idle sessions held; {counts['rejected']} "
+          f"guesses rejected, {counts['abandoned']} games abandoned after {MAX_ATTEMPTS} guesses")
+    print(f"Guess latency: p50 {percentile(samples, 0.5) * 1000:.2f} ms, p95 {percentile(samples, 0.95) * 1000:.2f} ms,"
+          f" p99 {p99:.2f} ms, max {samples[-1] * 1000:.2f} ms (target p99 <= {args.p99_target_ms} ms)")
+    return p99 <= args.p99_target_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the Wordle server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--clients", type=int, default=50, help="concurrent players")
+    parser.add_argument("--games", type=int, default=10, help="games per player")
+    parser.add_argument("--hold", type=int, default=0, help="idle games to open before the test")
+    parser.add_argument("--p99-target-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    if not asyncio.run(run(args)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import random
+from game import Game, NOT_WORD, WIN, LOSE, CONTINUE
+from scoring import score, all_green
+from tracing import traced
+try:
+    import numpy as np
+    from pattern_table import load_pattern_table
+except ImportError:  # NumPy is optional; without it each board's answer is scored with scoring.py
+    np = None
+    load_pattern_table = None
+
+'''multiboard.py plays one guess against several hidden words at once, like Quordle (4 boards) or Octordle (8). A
+MultiGame is a Game with one answer per board; a board is solved once a guess comes back all green, and later guesses
+leave it alone. Every guess is scored against all the boards in one call: a single lookup of the guess's row of the
+pattern table at the answers' indices, or one pass of scoring.py when NumPy is not installed. Boards + 5 guesses are
+allowed unless told otherwise (9 for Quordle, 13 for Octordle).'''
+
+
+class MultiGame(Game):
+    __slots__ = ("boards", "answers", "indices", "table", "solved")
+    mode = "multi"
+
+    def __init__(self, lexicon, boards=4, max_tries=None):
+        self.boards = boards
+        self.table = load_pattern_table(lexicon.words) if load_pattern_table is not None else None
+        super().__init__(lexicon, max_tries or boards + 5)
+
+    # ------ Start a new game, with random answers unless they are given ------
+    def reset(self, answers=None):
+        self.answers = list(answers or random.sample(self.lexicon.words, self.boards))
+        self.indices = [self.lexicon.index[answer] for answer in self.answers]
+        if self.table is not None:
+            self.indices = np.array(self.indices)
+        self.answer = ", ".join(self.answers)
+        self.tries = 1
+        self.letters.clear()
+        self.guesses = []
+        self.codes = []  # One list per guess: the pattern on each board, None where the board was already solved
+        self.candidates = self.lexicon.all
+        self.solved = [None] * self.boards  # Guess number that solved each board
+        self.over = False
+        self.won = False
+
+    # ------ Pattern of a guess on every board, in one batched call ------
+    def score_all(self, guess):
+        if self.table is not None:
+            return self.table[self.lexicon.index[guess], self.indices].tolist()
+        return [score(guess, answer) for answer in self.answers]
+
+    @traced
+    def submit(self, guess=None):
+        if self.over:
+            return None
+        if guess is None:
+            guess = "".join(self.letters)
+        if guess not in self.lexicon:
+            return NOT_WORD
+        solved_code = all_green(self.length)
+        codes = [None if self.solved[board] else code for board, code in enumerate(self.score_all(guess))]
+        for board, code in enumerate(codes):
+            if code == solved_code:
+                self.solved[board] = self.tries
+        self.guesses.append(guess)
+        self.codes.append(codes)
+        self.letters.clear()
+        if all(self.solved):
+            self.over = self.won = True
+            result = WIN
+        elif self.tries == self.max_tries:
+            self.over = True
+            result = LOSE
+        else:
+            result = CONTINUE
+        self.tries += 1
+        return result
+
+    # ------ Boards not solved yet ------
+    def unsolved(self):
+        return [board for board, tries in enumerate(self.solved) if tries is None]
+
+    def remaining(self):
+        return len(self.unsolved())
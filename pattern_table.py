@@ -0,0 +1,98 @@
+import os
+import hashlib
+import numpy as np
+from wordlist import CACHE_DIR
+
+'''pattern_table.py precomputes the feedback pattern (see scoring.py) of every guess against every answer as one matrix
+(uint8 for words of up to five letters, uint16 above, where patterns no longer fit a byte), so that solvers, hints and
+simulations can look feedback up with table[guess_index, answer_index] instead of scoring each pair again. The matrix is
+computed with vectorized NumPy operations a block of guesses at a time and cached in the cache/ folder as a .npy file,
+which later runs memory-map; each process maps a given list's table once. Lists too long for a table that fits in memory
+get None from load_pattern_table(); load_pattern_rows() gives them a PatternRows instead, which is indexed the same way
+but scores the rows asked for on demand (one guess against 50,000 answers takes about 17 ms).'''
+
+
+# ------ Constants ------
+CHUNK = 256  # Guesses scored per block; keeps each (guesses x answers) temporary to a few MB
+TABLE_LIMIT = 8000  # Longest list given a table: 8000 x 8000 uint16 is 128 MB
+
+
+# ------ Tables already loaded by this process, by word-list digest ------
+_tables = {}
+
+
+# ------ Smallest unsigned type that holds every pattern of a word length ------
+def pattern_dtype(length):
+    return np.uint8 if 3 ** length <= 256 else np.uint16
+
+
+# ------ Turn words into an (N, length) array of letter bytes ------
+def encode_words(words):
+    return np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8).reshape(len(words), -1)
+
+
+# ------ Score a block of guesses against all answers ------
+def score_block(guesses, answers):
+    length = guesses.shape[1]
+    green = [guesses[:, num, None] == answers[None, :, num] for num in range(0, length)]
+    dtype = pattern_dtype(length)
+    codes = np.zeros((len(guesses), len(answers)), dtype=dtype)
+    for num in range(0, length):
+        letter = guesses[:, num, None]
+        unmatched = sum((letter == answers[None, :, pos]) & ~green[pos] for pos in range(0, length))
+        claimed = sum((letter == guesses[:, pos, None]) & ~green[pos] for pos in range(0, num))
+        yellow = ~green[num] & (claimed < unmatched)  # earlier non-green copies use up the answer's spare copies
+        codes += (green[num] * 2 + yellow).astype(dtype) * dtype(3 ** num)
+    return codes
+
+
+# ------ Build the full guess x answer matrix ------
+def pattern_matrix(guess_words, answer_words=None):
+    guesses = encode_words(guess_words)
+    answers = guesses if answer_words is None else encode_words(answer_words)
+    matrix = np.empty((len(guesses), len(answers)), dtype=pattern_dtype(guesses.shape[1]))
+    for start in range(0, len(guesses), CHUNK):
+        matrix[start:start + CHUNK] = score_block(guesses[start:start + CHUNK], answers)
+    return matrix
+
+
+# ------ Rows of the matrix computed when asked for, for lists too long to store it; rows[guess(es), answers] ------
+class PatternRows:
+    def __init__(self, words):
+        self.encoded = encode_words(words)
+
+    def __getitem__(self, key):
+        guesses, answers = key  # An index and an array, or the two arrays of np.ix_
+        rows = score_block(self.encoded[np.ravel(guesses)], self.encoded[np.ravel(answers)])
+        return rows[0] if np.ndim(guesses) == 0 else rows
+
+
+# ------ The table when the list has one, otherwise rows on demand ------
+def load_pattern_rows(words):
+    table = load_pattern_table(words)
+    return PatternRows(words) if table is None else table
+
+
+# ------ Load the matrix for a word list from disk, building it the first time (None if the list is too long) ------
+def load_pattern_table(words):
+    if len(words) > TABLE_LIMIT:
+        return None
+    digest = hashlib.sha1("\n".join(words).encode("ascii")).hexdigest()[:16]
+    if digest not in _tables:
+        _tables[digest] = _load(digest, words)
+    return _tables[digest]
+
+
+def _load(digest, words):
+    path = os.path.join(CACHE_DIR, f"patterns-{digest}.npy")
+    if not os.path.exists(path):
+        matrix = pattern_matrix(words)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"  # Several worker processes may build the table at once
+            with open(temp_path, "wb") as file:
+                np.save(file, matrix)
+            os.replace(temp_path, path)
+        except OSError:  # Cache directory not writable: use the matrix from memory
+            return matrix
+    return np.load(path, mmap_mode="r")
@@ -0,0 +1,122 @@
+import sys
+import time
+from collections import deque
+
+'''scheduler.py runs all periodic UI work (the guess timer, animations) from one repeating Tk callback. Each task runs
+on its own interval (animation frames at 60 per second while they play, the timer every tenth of a second) and the one
+callback is armed for whichever task is due next. Runs are planned against time.monotonic() rather than chained
+window.after(1000) calls, so a busy mainloop makes a tick late but never makes the clock drift: every task gets the
+current monotonic time and works out what to show from that. Runs that were missed entirely are skipped (and counted
+per task), and how late each tick fired is recorded. A task that raises is
+reported through Tk and the others keep running, so one failure cannot stop the timer.'''
+
+
+# ------ Constants ------
+LATENESS_SAMPLES = 1000  # Most recent ticks kept for lateness stats
+EARLY = 0.002  # A task this close to due runs now; after() only has millisecond resolution
+
+
+class Scheduler:
+    def __init__(self, window, interval=0.1):
+        self.window = window
+        self.interval = interval  # Seconds between runs of a task added without its own interval
+        self.tasks = []  # Called with the current monotonic time when due
+        self.intervals = {}  # task -> seconds between its runs
+        self.due = {}  # task -> monotonic time of its next run
+        self.target = None
+        self.job = None
+        self.ticking = False
+        self.lateness = deque(maxlen=LATENESS_SAMPLES)
+        self.ticks = 0
+        self.skipped = {}  # task -> runs missed because the mainloop was busy, e.g. dropped animation frames
+
+    def add(self, task, interval=None):
+        self.tasks.append(task)
+        self.intervals[task] = interval or self.interval
+        self.due[task] = time.monotonic() + self.intervals[task]
+        self.skipped.setdefault(task, 0)
+        if not self.ticking:  # A tick in progress arms the next one when it ends
+            self._arm()
+
+    def remove(self, task):
+        if task in self.tasks:
+            self.tasks.remove(task)
+            del self.intervals[task], self.due[task]
+
+    # ------ Arm the callback for the task due first (moving it earlier if a new task is due sooner) ------
+    def _arm(self):
+        target = min(self.due.values())
+        if self.job is not None:
+            if target >= self.target:
+                return
+            self.window.after_cancel(self.job)
+        self.target = target
+        delay = max(0, target - time.monotonic())
+        self.job = self.window.after(round(delay * 1000), self._tick)
+
+    # ------ Run the tasks that are due, then plan each one's next run on its own monotonic grid ------
+    def _tick(self):
+        now = time.monotonic()
+        self.lateness.append(now - self.target)
+        self.job = None
+        self.ticking = True
+        ran = []
+        try:
+            for task in list(self.tasks):
+                if self.due.get(task, now + EARLY + 1) > now + EARLY:  # Not due yet, or removed by an earlier task
+                    continue
+                ran.append(task)
+                try:
+                    task(now)
+                except Exception:
+                    self.window.report_callback_exception(*sys.exc_info())  # Prints it, as for any Tk callback
+        finally:
+            self.ticks += 1
+            self.ticking = False
+            late = time.monotonic()
+            for task in ran:
+                if task in self.due:
+                    missed = max(0, int((late - self.due[task]) // self.intervals[task]))  # Due while we were busy
+                    self.skipped[task] += missed
+                    self.due[task] += (missed + 1) * self.intervals[task]
+            if self.tasks:  # Otherwise the last task removed itself: stand down until add() is called again
+                self._arm()
+
+    def stop(self):
+        if self.job is not None:
+            self.window.after_cancel(self.job)
+            self.job = None
+
+    # ------ How late ticks fired, in milliseconds ------
+    def stats(self):
+        samples = sorted(self.lateness)
+        if not samples:
+            return {"ticks": 0}
+        return {"ticks": len(samples),
+                "p50": samples[len(samples) // 2] * 1000,
+                "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+                "max": samples[-1] * 1000}
+
+
+class Countdown:
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.deadline = None
+
+    def start(self, now=None, seconds=None):
+        self.deadline = (time.monotonic() if now is None else now) + (self.seconds if seconds is None else seconds)
+
+    def stop(self):
+        self.deadline = None
+
+    def running(self):
+        return self.deadline is not None
+
+    # ------ Seconds left, worked out from the deadline ------
+    def remaining(self, now=None):
+        if self.deadline is None:
+            return self.seconds
+        return max(0.0, self.deadline - (time.monotonic() if now is None else now))
+
+    def expired(self, now=None):
+        return self.deadline is not None and self.remaining(now) == 0
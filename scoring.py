@@ -0,0 +1,54 @@
+'''scoring.py holds the feedback rules for Wordle_FinalProject.py, kept apart from the UI so that solvers, hints and
+simulations can use them too. Feedback is returned as a compact base-3 pattern code: each position contributes a digit
+(0 = gray, 1 = yellow, 2 = green) weighted by 3 ** position, so a five-letter pattern fits in a single byte (0-242).
+Repeated letters follow the NYT rules: greens are marked first, then yellows from left to right only while the answer
+still has unmatched copies of that letter.'''
+
+
+# ------ Constants ------
+GRAY = 0
+YELLOW = 1
+GREEN = 2
+COLORS = ("gray", "yellow", "green")
+
+
+# ------ Score a guess against an answer ------
+def score(guess, answer):
+    pattern = [GRAY] * len(guess)
+    unmatched = {}
+    for num in range(0, len(guess)):
+        if guess[num] == answer[num]:
+            pattern[num] = GREEN
+        else:
+            unmatched[answer[num]] = unmatched.get(answer[num], 0) + 1
+    for num in range(0, len(guess)):
+        if pattern[num] != GREEN and unmatched.get(guess[num], 0) > 0:
+            pattern[num] = YELLOW
+            unmatched[guess[num]] -= 1
+    return encode(pattern)
+
+
+# ------ Convert between digit lists and pattern codes ------
+def encode(pattern):
+    code = 0
+    for digit in reversed(pattern):
+        code = code * 3 + digit
+    return code
+
+
+def decode(code, length=5):
+    pattern = []
+    for _ in range(0, length):
+        pattern.append(code % 3)
+        code //= 3
+    return pattern
+
+
+# ------ Color names used by the UI ------
+def colors(code, length=5):
+    return [COLORS[digit] for digit in decode(code, length)]
+
+
+# ------ Pattern code of a solved word ------
+def all_green(length=5):
+    return 3 ** length - 1
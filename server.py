@@ -0,0 +1,238 @@
+import json
+import time
+import base64
+import asyncio
+import hashlib
+import argparse
+import secrets
+from game import Game, NOT_WORD, NOT_HARD
+from lexicon import lexicon_for
+from scoring import colors
+from wordlist import WORD_LENGTH, LENGTHS
+
+'''server.py hosts many Wordle games at once, headless, on asyncio. Every session is one Game (see game.py) and all of
+them share a single read-only Lexicon. The API is plain JSON over a small HTTP/1.1 server with keep-alive:
+
+    POST /games                 start a game            -> {"id": ..., "length": 5, "max_tries": 6}
+    POST /games/<id>/guess      body {"guess": "crane"} -> result, colors, remaining words and state
+    GET  /games/<id>            current state
+
+The same three operations are available over a WebSocket at /ws by sending {"op": "new"}, {"op": "guess", "id": ...,
+"guess": ...} or {"op": "state", "id": ...}. Start it with "python server.py --port 8080"; loadtest.py measures it.'''
+
+
+# ------ Constants ------
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 503: "Service Unavailable"}
+MAX_BODY = 4096  # Bytes accepted in a request body or a WebSocket frame; every operation fits in far less
+
+
+class Session:
+    __slots__ = ("game", "last_seen")
+
+    def __init__(self, game):
+        self.game = game
+        self.last_seen = time.monotonic()
+
+
+class WordleServer:
+    def __init__(self, lexicon, max_sessions=100000, idle_timeout=3600, hard_mode=False, max_tries=6):
+        self.lexicon = lexicon
+        self.max_tries = max_tries
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.hard_mode = hard_mode
+        self.sessions = {}
+
+    # ------------ Game operations (shared by HTTP and WebSocket) ------------
+    def new_game(self):
+        if len(self.sessions) >= self.max_sessions:
+            return 503, {"error": "too many sessions"}
+        session_id = secrets.token_urlsafe(9)
+        game = Game(self.lexicon, self.max_tries, self.hard_mode)
+        self.sessions[session_id] = Session(game)
+        return 201, {"id": session_id, "length": game.length, "max_tries": game.max_tries}
+
+    def state(self, session_id):
+        session = self.sessions.get(session_id)
+        if session is None:
+            return 404, {"error": "no such game"}
+        session.last_seen = time.monotonic()
+        game = session.game
+        state = {"id": session_id, "guesses": game.guesses, "codes": game.codes, "over": game.over, "won": game.won,
+                 "remaining": game.remaining()}
+        if game.over:
+            state["answer"] = game.answer
+        return 200, state
+
+    def guess(self, session_id, guess):
+        session = self.sessions.get(session_id)
+        if session is None:
+            return 404, {"error": "no such game"}
+        if not isinstance(guess, str):
+            return 400, {"error": "guess must be a string"}
+        result = session.game.submit(guess.lower())
+        if result is None:
+            return 400, {"error": "game is over"}
+        if result in (NOT_WORD, NOT_HARD):
+            return 400, {"error": "not in word list" if result == NOT_WORD else "guess ignores a revealed hint"}
+        status, state = self.state(session_id)
+        state["result"] = result
+        state["colors"] = colors(session.game.codes[-1], self.lexicon.length)
+        return status, state
+
+    # ------ Drop sessions nobody has touched for a while ------
+    async def sweep(self):
+        while True:
+            await asyncio.sleep(max(1, self.idle_timeout / 10))
+            cutoff = time.monotonic() - self.idle_timeout
+            for session_id in [key for key, session in self.sessions.items() if session.last_seen < cutoff]:
+                del self.sessions[session_id]
+
+    # ------------ HTTP ------------
+    def route(self, method, path, body):
+        parts = path.strip("/").split("/")
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"error": "body must be JSON"}
+        if not isinstance(data, dict):
+            return 400, {"error": "body must be a JSON object"}
+        if parts == ["games"]:
+            return self.new_game() if method == "POST" else (405, {"error": "use POST"})
+        if len(parts) == 2 and parts[0] == "games":
+            return self.state(parts[1]) if method == "GET" else (405, {"error": "use GET"})
+        if len(parts) == 3 and parts[0] == "games" and parts[2] == "guess":
+            return self.guess(parts[1], data.get("guess")) if method == "POST" else (405, {"error": "use POST"})
+        return 404, {"error": "not found"}
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY:  # The body is not read, so the connection cannot be reused
+                    await self.respond(writer, 413, {"error": f"body is over {MAX_BODY} bytes"})
+                    break
+                body = await reader.readexactly(length)
+                if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                    if "sec-websocket-key" not in headers:
+                        await self.respond(writer, 400, {"error": "missing Sec-WebSocket-Key"})
+                    else:
+                        await self.websocket(reader, writer, headers)
+                    break
+                await self.respond(writer, *self.route(method, path, body))
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, payload):
+        data = json.dumps(payload).encode()
+        writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+        await writer.drain()
+
+    # ------------ WebSocket (text frames carrying the same JSON operations) ------------
+    async def websocket(self, reader, writer, headers):
+        accept = base64.b64encode(hashlib.sha1((headers["sec-websocket-key"] + WS_GUID).encode()).digest()).decode()
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode())
+        while True:
+            try:
+                opcode, payload = await read_frame(reader)
+            except OverflowError:  # Close with 1009 (message too big) without reading the frame
+                writer.write(encode_frame(8, (1009).to_bytes(2, "big")))
+                await writer.drain()
+                return
+            if opcode == 8:  # Close
+                writer.write(encode_frame(8, b""))
+                await writer.drain()
+                return
+            if opcode == 9:  # Ping
+                writer.write(encode_frame(10, payload))
+            elif opcode == 1:
+                try:
+                    message = json.loads(payload)
+                except ValueError:
+                    message = None
+                if not isinstance(message, dict):
+                    message = {}
+                operation = message.get("op")
+                if operation == "new":
+                    status, reply = self.new_game()
+                elif operation == "guess":
+                    status, reply = self.guess(message.get("id"), message.get("guess"))
+                elif operation == "state":
+                    status, reply = self.state(message.get("id"))
+                else:
+                    status, reply = 400, {"error": "op must be new, guess or state"}
+                reply["status"] = status
+                writer.write(encode_frame(1, json.dumps(reply).encode()))
+            await writer.drain()
+
+
+async def read_frame(reader):
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        length = int.from_bytes(await reader.readexactly(2), "big")
+    elif length == 127:
+        length = int.from_bytes(await reader.readexactly(8), "big")
+    if length > MAX_BODY:
+        raise OverflowError(f"frame of {length} bytes")
+    mask = await reader.readexactly(4) if second & 0x80 else b"\0\0\0\0"
+    payload = await reader.readexactly(length)
+    return first & 0x0F, bytes(byte ^ mask[num % 4] for num, byte in enumerate(payload))
+
+
+def encode_frame(opcode, payload):
+    if len(payload) < 126:
+        header = bytes([0x80 | opcode, len(payload)])
+    elif len(payload) < 1 << 16:
+        header = bytes([0x80 | opcode, 126]) + len(payload).to_bytes(2, "big")
+    else:
+        header = bytes([0x80 | opcode, 127]) + len(payload).to_bytes(8, "big")
+    return header + payload
+
+
+async def serve(host, port, server):
+    listener = await asyncio.start_server(server.handle, host, port, backlog=1024)
+    asyncio.get_running_loop().create_task(server.sweep())
+    print(f"Serving Wordle on http://{host}:{port} ({len(server.lexicon)} words)")
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless multi-session Wordle server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-sessions", type=int, default=100000)
+    parser.add_argument("--idle-timeout", type=float, default=3600, help="seconds before an idle game is dropped")
+    parser.add_argument("--hard", action="store_true", help="every guess must fit the hints revealed so far")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH, choices=LENGTHS, help="letters per word")
+    parser.add_argument("--max-tries", type=int, default=6, help="guesses allowed per game")
+    args = parser.parse_args()
+    server = WordleServer(lexicon_for(args.length), args.max_sessions, args.idle_timeout, args.hard, args.max_tries)
+    try:
+        asyncio.run(serve(args.host, args.port, server))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import os
+import time
+import argparse
+import importlib
+from collections import Counter
+from multiprocessing import Pool
+from game import Game
+from lexicon import Lexicon
+from wordlist import load_wordlist, WORD_LENGTH, LENGTHS
+from strategies import STRATEGIES
+
+'''simulate.py plays every answer in the word list against a guessing strategy, headless, across several processes,
+and reports games per second, the win rate and how many guesses the wins took. Example:
+
+    python simulate.py --strategy entropy --rounds 10
+
+--strategy takes a name from strategies.py or "module:Class" for a strategy defined elsewhere.'''
+
+
+# ------ Worker process state ------
+_game = None
+_strategy = None
+
+
+def load_strategy(name):
+    if ":" in name:
+        module, cls = name.split(":", 1)
+        return getattr(importlib.import_module(module), cls)
+    return STRATEGIES[name]
+
+
+def _init_worker(words, strategy_name, max_tries):
+    global _game, _strategy
+    _game = Game(Lexicon(words), max_tries)
+    _strategy = load_strategy(strategy_name)(words)
+
+
+# ------ Play one chunk of answers; counts guesses per game (None for a loss) ------
+def play_chunk(answers):
+    results = Counter()
+    for answer in answers:
+        results[_game.play(_strategy, answer)] += 1
+    return results
+
+
+# ------ Print games/sec, win rate and guess distribution ------
+def report(results, elapsed, max_tries):
+    games = sum(results.values())
+    wins = games - results[None]
+    print(f"Played {games} games in {elapsed:.2f} s ({games / elapsed:,.0f} games/sec)")
+    print(f"Win rate: {wins / games:.2%}")
+    if wins:
+        average = sum(tries * count for tries, count in results.items() if tries) / wins
+        print(f"Average guesses per win: {average:.3f}")
+    for tries in list(range(1, max_tries + 1)) + [None]:
+        count = results[tries]
+        label = tries if tries else "X"
+        print(f"  {label}: {count:>9} {count / games:7.2%} {'#' * round(40 * count / games)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play every Wordle answer against a guessing strategy.")
+    parser.add_argument("--strategy", default="entropy", help="name from strategies.py or module:Class")
+    parser.add_argument("--rounds", type=int, default=1, help="times to play through the word list")
+    parser.add_argument("--limit", type=int, default=None, help="only use the first N answers")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--chunk", type=int, default=200, help="answers per task sent to a worker")
+    parser.add_argument("--max-tries", type=int, default=6, help="guesses allowed per game")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH, choices=LENGTHS, help="letters per word")
+    args = parser.parse_args()
+
+    words = load_wordlist(args.length)
+    load_strategy(args.strategy)  # Fail here, not inside every worker, if the strategy does not exist
+    answers = words[:args.limit] * args.rounds
+    chunks = [answers[start:start + args.chunk] for start in range(0, len(answers), args.chunk)]
+    results = Counter()
+    start = time.perf_counter()
+    with Pool(args.workers, initializer=_init_worker, initargs=(words, args.strategy, args.max_tries)) as pool:
+        for chunk_results in pool.imap_unordered(play_chunk, chunks):
+            results.update(chunk_results)
+    report(results, time.perf_counter() - start, args.max_tries)
+
+
+if __name__ == "__main__":
+    main()
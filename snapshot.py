@@ -0,0 +1,43 @@
+import struct
+import zlib
+
+'''snapshot.py packs the whole state of a game into a few bytes: the answer and guesses as indices into the word list,
+plus the time left on the guess timer. A checksum of the word list is stored as well, so a snapshot is never restored
+against a different list (where the same indices would mean other words), and so are the guesses allowed and the mode,
+so a game is never resumed under rules that would end or score it differently. The guesses are replayed on restore,
+which rebuilds the feedback and remaining candidates exactly.'''
+
+
+# ------ Constants ------
+VERSION = 2
+# version, word length, word list crc32, answer, ms left on timer, guesses allowed, mode, hard mode, guess count
+HEADER = struct.Struct("<BBIHIBBBB")
+MODES = ("classic", "absurdle", "multi")  # Game.mode values, stored as their index
+
+
+def word_list_checksum(lexicon):
+    return zlib.crc32("".join(lexicon.words).encode("ascii"))
+
+
+# ------ Game -> bytes ------
+def pack_state(game, remaining):
+    lexicon = game.lexicon
+    guesses = [lexicon.index[guess] for guess in game.guesses]
+    return HEADER.pack(VERSION, lexicon.length, word_list_checksum(lexicon), lexicon.index[game.answer],
+                       round(remaining * 1000), game.max_tries, MODES.index(game.mode), int(game.hard_mode),
+                       len(guesses)) + struct.pack(f"<{len(guesses)}H", *guesses)
+
+
+# ------ bytes -> (answer, guesses, seconds left), or None if the snapshot was not saved by a game like this one ------
+def unpack_state(data, game):
+    lexicon = game.lexicon
+    try:
+        version, length, checksum, answer, remaining, max_tries, mode, hard_mode, count = HEADER.unpack_from(data)
+        guesses = struct.unpack_from(f"<{count}H", data, HEADER.size)
+    except struct.error:
+        return None
+    if version != VERSION or length != lexicon.length or checksum != word_list_checksum(lexicon):
+        return None
+    if max_tries != game.max_tries or mode != MODES.index(game.mode) or hard_mode != game.hard_mode:
+        return None
+    return lexicon.words[answer], [lexicon.words[guess] for guess in guesses], remaining / 1000
@@ -0,0 +1,149 @@
+import os
+import json
+import argparse
+from store import DATA_DIR
+
+'''stats.py keeps statistics over every finished game. Each game is appended as one JSON line to an append-only log
+(data/games.log); the aggregates (win rate, streaks, guess distribution, time used per guess) are counters updated once
+per game and saved next to the log together with how many bytes of the log they cover. Opening the stats panel reads
+those counters, so it costs the same with ten games or ten million; only log lines written after the counters were last
+saved (e.g. after a crash) are folded in at startup. Lines that are not a valid game record are skipped, and a
+half-written last line is cut off before the next game is appended. "python stats.py" prints the same numbers.
+
+Log line: {"answer": "crane", "guesses": ["slate", "crane"], "won": true, "timeout": false, "times": [12.4, 8.1]}
+where times are the seconds used on each guess (null when unknown, e.g. for guesses made before a resumed game).'''
+
+
+# ------ Constants ------
+MAX_TRIES = 6
+TIME_LIMIT = 45
+TIME_BUCKET = 5  # Seconds per bucket of the time-per-guess histogram
+
+
+def empty_counters():
+    return {"games": 0, "wins": 0, "timeouts": 0, "streak": 0, "max_streak": 0,
+            "distribution": [0] * MAX_TRIES, "timed_guesses": 0, "guess_seconds": 0.0,
+            "time_buckets": [0] * (TIME_LIMIT // TIME_BUCKET), "offset": 0}
+
+
+# ------ A log line fold() can count: an object with a won flag, a list of guesses and, if given, a list of times ------
+def valid_record(record):
+    if not isinstance(record, dict) or not isinstance(record.get("won"), bool):
+        return False
+    if not isinstance(record.get("guesses"), list) or (record["won"] and not record["guesses"]):
+        return False
+    times = record.get("times", [])
+    return isinstance(times, list) and all(seconds is None or isinstance(seconds, (int, float)) for seconds in times)
+
+
+class StatsLog:
+    def __init__(self, data_dir=DATA_DIR):
+        self.log_path = os.path.join(data_dir, "games.log")
+        self.counters_path = os.path.join(data_dir, "stats.json")
+        self.counters = self._load_counters()
+        self.torn = None  # Where a half-written last line starts; it is cut off before the next append
+        self._catch_up()
+
+    def _load_counters(self):
+        try:
+            with open(self.counters_path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return empty_counters()
+
+    # ------ Fold in log lines the saved counters do not cover yet (streamed, nothing kept in memory) ------
+    def _catch_up(self):
+        try:
+            size = os.path.getsize(self.log_path)
+        except OSError:
+            return
+        if size < self.counters["offset"]:  # Log was replaced: start over
+            self.counters = empty_counters()
+        if size == self.counters["offset"]:
+            return
+        with open(self.log_path, "rb") as file:
+            file.seek(self.counters["offset"])
+            for line in file:
+                if not line.endswith(b"\n"):  # Half-written last line from a crash
+                    self.torn = self.counters["offset"]
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:  # Corrupted line: skipped
+                    record = None
+                if valid_record(record):
+                    self.fold(record)
+                self.counters["offset"] += len(line)
+
+    # ------ Update the counters with one finished game ------
+    def fold(self, record):
+        counters = self.counters
+        counters["games"] += 1
+        if record["won"]:
+            counters["wins"] += 1
+            counters["streak"] += 1
+            counters["max_streak"] = max(counters["max_streak"], counters["streak"])
+            distribution = counters["distribution"]
+            tries = len(record["guesses"])
+            if tries > len(distribution):  # Played with more than six guesses allowed
+                distribution.extend([0] * (tries - len(distribution)))
+            distribution[tries - 1] += 1
+        else:
+            counters["streak"] = 0
+        if record.get("timeout"):
+            counters["timeouts"] += 1
+        for seconds in record.get("times", []):
+            if seconds is not None:
+                counters["timed_guesses"] += 1
+                counters["guess_seconds"] += seconds
+                bucket = min(int(seconds // TIME_BUCKET), len(counters["time_buckets"]) - 1)
+                counters["time_buckets"][bucket] += 1
+
+    # ------ Fold a game in now; returns (log line, counters) for the writer thread to append ------
+    def add(self, record):
+        line = json.dumps(record) + "\n"
+        self.fold(record)
+        self.counters["offset"] += len(line.encode())
+        return line, json.loads(json.dumps(self.counters))  # Copy, the writer saves it later
+
+    # ------ Append lines and save the counters that include them (runs on the writer thread) ------
+    def append(self, lines, counters):
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        if self.torn is not None:  # New lines must start where the counters think the log ends
+            with open(self.log_path, "r+b") as file:
+                file.truncate(self.torn)
+            self.torn = None
+        with open(self.log_path, "a") as file:
+            file.writelines(lines)
+        with open(self.counters_path + ".tmp", "w") as file:
+            json.dump(counters, file)
+        os.replace(self.counters_path + ".tmp", self.counters_path)
+
+    # ------ Numbers for the stats panel ------
+    def summary(self):
+        counters = self.counters
+        games = counters["games"]
+        return {"games": games,
+                "win_rate": counters["wins"] / games if games else 0.0,
+                "streak": counters["streak"],
+                "max_streak": counters["max_streak"],
+                "distribution": counters["distribution"],
+                "timeouts": counters["timeouts"],
+                "seconds_per_guess": (counters["guess_seconds"] / counters["timed_guesses"]
+                                      if counters["timed_guesses"] else 0.0),
+                "time_buckets": counters["time_buckets"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print Wordle statistics.")
+    parser.add_argument("--data-dir", default=DATA_DIR)
+    summary = StatsLog(parser.parse_args().data_dir).summary()
+    print(f"Played {summary['games']}, won {summary['win_rate']:.0%}, current streak {summary['streak']}, "
+          f"max streak {summary['max_streak']}, ran out of time {summary['timeouts']} times")
+    for tries, count in enumerate(summary["distribution"], start=1):
+        print(f"  {tries}: {count}")
+    print(f"Average time per guess: {summary['seconds_per_guess']:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import os
+import time
+import queue
+import sqlite3
+import threading
+
+'''store.py saves games in the background so that disk I/O never slows down a guess. Finished games are queued and
+written to a local SQLite database in batches by a single writer thread; the same thread keeps the snapshot of the game
+in progress (see snapshot.py) in a small file, so a crashed or closed game can be resumed. Whatever has queued up while
+the writer was busy goes out together in one transaction, and only the newest snapshot in a batch is written.'''
+
+
+# ------ Constants ------
+DATA_DIR = os.environ.get("WORDLE_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+BATCH_SIZE = 100
+
+
+class GameStore:
+    def __init__(self, data_dir=DATA_DIR, log=None, snapshot="current_game"):
+        self.data_dir = data_dir
+        self.log = log  # Optional StatsLog (see stats.py); its lines are appended by the writer too
+        self.db_path = os.path.join(data_dir, "games.sqlite3")
+        self.snapshot_path = os.path.join(data_dir, f"{snapshot}.snap")  # One file per set of game options
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    # ------------ Called from the game (never blocks on disk) ------------
+    def record(self, game, state, log_entry=None):
+        self.queue.put(("game", (time.time(), game.answer, ",".join(game.guesses), int(game.won), state)))
+        if log_entry is not None:
+            self.queue.put(("log", log_entry))
+
+    def save_snapshot(self, state):
+        self.queue.put(("snapshot", state))
+
+    def clear_snapshot(self):
+        self.queue.put(("snapshot", None))
+
+    # ------ Read the snapshot at startup (None if there is no game to resume) ------
+    def load_snapshot(self):
+        try:
+            with open(self.snapshot_path, "rb") as file:
+                return file.read()
+        except OSError:
+            return None
+
+    # ------ Write everything still queued and stop the writer ------
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+    # ------------ Writer thread ------------
+    def _run(self):
+        os.makedirs(self.data_dir, exist_ok=True)
+        connection = sqlite3.connect(self.db_path)
+        connection.execute("CREATE TABLE IF NOT EXISTS games (id INTEGER PRIMARY KEY, finished REAL, answer TEXT, "
+                           "guesses TEXT, won INTEGER, state BLOB)")
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            running = None not in batch
+            games = [data for kind, data in filter(None, batch) if kind == "game"]
+            snapshots = [data for kind, data in filter(None, batch) if kind == "snapshot"]
+            log_entries = [data for kind, data in filter(None, batch) if kind == "log"]
+            if games:
+                connection.executemany("INSERT INTO games (finished, answer, guesses, won, state) "
+                                       "VALUES (?, ?, ?, ?, ?)", games)
+                connection.commit()
+            if log_entries:
+                self.log.append([line for line, _ in log_entries], log_entries[-1][1])
+            if snapshots:
+                self._write_snapshot(snapshots[-1])
+        connection.close()
+
+    def _write_snapshot(self, state):
+        if state is None:
+            if os.path.exists(self.snapshot_path):
+                os.remove(self.snapshot_path)
+            return
+        with open(self.snapshot_path + ".tmp", "wb") as file:
+            file.write(state)
+        os.replace(self.snapshot_path + ".tmp", self.snapshot_path)
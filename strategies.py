@@ -0,0 +1,77 @@
+import random
+from scoring import score
+from hints import table_entropies, entropy, spread, load_pattern_rows, np, SAMPLE_LIMIT, TABLE_LIMIT
+
+'''strategies.py holds guessing strategies for simulate.py. A strategy is any class built with the word list that has
+reset() (new game), guess() (next word to play) and update(guess, code) (feedback from scoring.py); simulate.py also
+accepts "module:Class" to load one from elsewhere. Candidates are kept as word indices and, when NumPy is installed,
+narrowed with one vectorized lookup in the pattern table per guess (rows scored on demand for lists too long for a
+table). Without a full table Entropy ranks an even sample of SAMPLE_LIMIT candidates against itself, as hints.py does,
+so each guess over a 6-8 letter list takes a fraction of a second instead of scanning every pair.'''
+
+
+class FirstCandidate:
+    def __init__(self, words):
+        self.words = words
+        self.index = {word: num for num, word in enumerate(words)}
+        self.table = load_pattern_rows(words) if load_pattern_rows is not None else None
+        self.candidates = []
+
+    def reset(self):
+        if self.table is not None:
+            self.candidates = np.arange(len(self.words))
+        else:
+            self.candidates = list(range(len(self.words)))
+
+    # ------ Play the first word still consistent with the feedback ------
+    def guess(self):
+        return self.words[self.candidates[0]]
+
+    def update(self, guess, code):
+        if self.table is not None:
+            self.candidates = self.candidates[self.table[self.index[guess], self.candidates] == code]
+        else:
+            self.candidates = [answer for answer in self.candidates if score(guess, self.words[answer]) == code]
+
+
+class RandomCandidate(FirstCandidate):
+    def guess(self):
+        return self.words[random.choice(self.candidates)]
+
+
+class Entropy(FirstCandidate):
+    def __init__(self, words):
+        super().__init__(words)
+        self.patterns = 3 ** len(words[0])
+        self.memo = {}  # The strategy is deterministic, so the guess for a given history only needs finding once
+        self.history = ()
+
+    def reset(self):
+        super().reset()
+        self.history = ()
+
+    # ------ Play the guess with the highest expected information, preferring possible answers on ties ------
+    def guess(self):
+        if self.history not in self.memo:
+            if len(self.candidates) <= 2:
+                best = self.candidates[0]
+            elif self.table is not None and len(self.words) <= TABLE_LIMIT:
+                bits = table_entropies(self.table, range(len(self.words)), self.candidates, self.patterns).tolist()
+                candidates = set(self.candidates.tolist())
+                best = max(range(len(self.words)), key=lambda num: (bits[num], num in candidates))
+            else:  # Without a full table a sample of the candidates is ranked against itself, as hints.py does
+                sample = spread(self.candidates, SAMPLE_LIMIT)
+                if self.table is not None:
+                    bits = table_entropies(self.table, sample, sample, self.patterns).tolist()
+                else:
+                    bits = [entropy(self.words, num, sample) for num in sample]
+                best = int(sample[bits.index(max(bits))])
+            self.memo[self.history] = best
+        return self.words[self.memo[self.history]]
+
+    def update(self, guess, code):
+        super().update(guess, code)
+        self.history += ((self.index[guess], code),)
+
+
+STRATEGIES = {"first": FirstCandidate, "random": RandomCandidate, "entropy": Entropy}
@@ -0,0 +1,29 @@
+import os
+import sys
+import random
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # The project's flat modules
+from scoring import encode, GRAY, YELLOW, GREEN
+
+'''helpers.py holds what the test files share: a brute-force reference for scoring and small random word lists that
+repeat letters often. pytest puts tests/ on sys.path, so test files import it as "helpers" before the project modules.'''
+
+
+# ------ Constants ------
+LENGTHS = range(4, 9)
+LETTERS = "aabbcdeeest"  # Few letters, some weighted, so words repeat letters often
+
+
+# ------ Reference scoring: a guess letter is yellow while the answer has more unmatched copies than came before it ------
+def brute_score(guess, answer):
+    green = [guess[num] == answer[num] for num in range(0, len(guess))]
+    pattern = []
+    for num, letter in enumerate(guess):
+        unmatched = sum(1 for pos in range(0, len(answer)) if answer[pos] == letter and not green[pos])
+        claimed = sum(1 for pos in range(0, num) if guess[pos] == letter and not green[pos])
+        pattern.append(GREEN if green[num] else YELLOW if claimed < unmatched else GRAY)
+    return encode(pattern)
+
+
+def random_words(length, count=300, seed=0):
+    rng = random.Random(seed + length)
+    return sorted({"".join(rng.choice(LETTERS) for _ in range(0, length)) for _ in range(0, count)})
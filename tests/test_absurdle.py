@@ -0,0 +1,76 @@
+import random
+import pytest
+from helpers import LENGTHS, random_words
+from scoring import score
+from lexicon import Lexicon
+from game import WIN
+import absurdle
+from absurdle import AdversarialGame, partition, partition_words
+try:
+    import numpy as np
+    from pattern_table import pattern_matrix
+except ImportError:  # NumPy not installed: only the scoring.py path is tested
+    np = None
+
+'''test_absurdle.py checks that the adversarial game keeps the largest group of candidates, and that the pattern-table
+path and the scoring.py path (used without NumPy) pick the same pattern for every guess. Run with
+"python -m pytest tests".'''
+
+
+def play(lexicon, guesses):
+    game = AdversarialGame(lexicon, len(guesses))
+    game.reset()
+    results = [game.submit(guess) for guess in guesses]
+    return results, game.codes, game.remaining_words(), game.answer
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_partition_words_keeps_largest_group(length):
+    words = random_words(length)
+    for guess in random.Random(length).sample(words, 10):
+        sizes = {}
+        for word in words:
+            sizes[score(guess, word)] = sizes.get(score(guess, word), 0) + 1
+        code = partition_words(guess, words)
+        assert sizes[code] == max(sizes.values())
+        assert code == min(pattern for pattern, size in sizes.items() if size == sizes[code])  # Lowest on ties
+
+
+@pytest.mark.skipif(np is None, reason="needs NumPy")
+@pytest.mark.parametrize("length", LENGTHS)
+def test_partition_matches_partition_words(length):
+    words = random_words(length)
+    table = pattern_matrix(words)
+    rng = random.Random(length)
+    for _ in range(0, 20):
+        candidates = np.array(sorted(rng.sample(range(len(words)), rng.randint(1, len(words)))))
+        guess = rng.randrange(len(words))
+        code, kept = partition(table, guess, candidates, 3 ** length)
+        assert code == partition_words(words[guess], [words[num] for num in candidates])
+        assert candidates[kept].tolist() == [num for num in candidates if score(words[guess], words[num]) == code]
+
+
+@pytest.mark.skipif(np is None, reason="needs NumPy")
+@pytest.mark.parametrize("length", LENGTHS)
+def test_game_without_numpy_plays_the_same(length, monkeypatch):
+    lexicon = Lexicon(random_words(length))
+    guesses = random.Random(length).sample(lexicon.words, 6)
+    with_table = play(lexicon, guesses)
+    monkeypatch.setattr(absurdle, "load_pattern_rows", None)
+    assert play(lexicon, guesses) == with_table
+
+
+def test_game_is_won_only_when_cornered():
+    lexicon = Lexicon(random_words(5))
+    game = AdversarialGame(lexicon, 100)
+    game.reset()
+    while not game.over:
+        assert game.answer in game.remaining_words()
+        result = game.submit(game.answer)
+    assert result == WIN and game.remaining_words() == [game.answer]
+
+
+def test_reset_refuses_an_answer():
+    game = AdversarialGame(Lexicon(random_words(5)))
+    with pytest.raises(ValueError):
+        game.reset("aabbc")
@@ -0,0 +1,86 @@
+import random
+import pytest
+from helpers import random_words
+from scoring import score, all_green
+from lexicon import Lexicon
+from game import Game, NOT_WORD, NOT_HARD, WIN, LOSE, CONTINUE
+import strategies
+from strategies import STRATEGIES, Entropy
+
+'''test_game.py plays the headless Game: typing, win and loss, the candidates left after each guess, hard mode, and
+whole games driven by the simulate.py strategies (Entropy also as it plays lists too long for a table). Run with
+"python -m pytest tests".'''
+
+
+@pytest.fixture
+def lexicon():
+    return Lexicon(random_words(5))
+
+
+def test_typing_and_submit(lexicon):
+    game = Game(lexicon, 6)
+    game.reset(lexicon.words[0])
+    guess = lexicon.words[1]
+    assert [game.add_letter(char) for char in guess + "x"] == [0, 1, 2, 3, 4, None]
+    assert game.remove_letter() == 4 and game.add_letter(guess[-1]) == 4
+    assert game.submit() == CONTINUE
+    assert game.letters == [] and game.guesses == [guess] and game.codes == [score(guess, game.answer)]
+    assert game.submit("zzzzz") == NOT_WORD and game.tries == 2
+
+
+def test_win_and_lose(lexicon):
+    game = Game(lexicon, 3)
+    game.reset(lexicon.words[0])
+    assert game.submit(lexicon.words[0]) == WIN and game.over and game.won
+    assert game.submit(lexicon.words[1]) is None
+    game.reset(lexicon.words[0])
+    assert [game.submit(word) for word in lexicon.words[1:4]] == [CONTINUE, CONTINUE, LOSE]
+    assert game.over and not game.won and not game.expire()
+
+
+def test_remaining_matches_feedback(lexicon):
+    game = Game(lexicon, 6)
+    game.reset(lexicon.words[5])
+    for guess in random.Random(1).sample(lexicon.words, 3):
+        game.submit(guess)
+    expected = [word for word in lexicon.words if all(score(guess, word) == code
+                                                      for guess, code in zip(game.guesses, game.codes))]
+    assert game.remaining_words() == expected and game.remaining() == len(expected)
+    assert game.answer in expected
+
+
+def test_hard_mode_only_takes_possible_answers(lexicon):
+    game = Game(lexicon, 6, hard_mode=True)
+    answer = lexicon.words[0]
+    first = next(word for word in lexicon.words if sum(score(word, other) == score(word, answer)
+                                                       for other in lexicon.words) > 2)
+    game.reset(answer)
+    game.submit(first)
+    possible = set(game.remaining_words())
+    ruled_out = next(word for word in lexicon.words if word not in possible)
+    assert game.submit(ruled_out) == NOT_HARD
+    assert game.tries == 2 and game.guesses == [first]
+    allowed = next(word for word in lexicon.words if word in possible and word != game.answer)
+    assert game.submit(allowed) == CONTINUE
+
+
+@pytest.mark.parametrize("name", sorted(STRATEGIES))
+def test_play_with_strategy(lexicon, name):
+    game = Game(lexicon, 20)
+    strategy = STRATEGIES[name](lexicon.words)
+    for answer in lexicon.words[::25]:
+        tries = game.play(strategy, answer)
+        assert tries is not None and game.guesses[-1] == answer
+        assert game.codes[-1] == all_green(5)
+
+
+@pytest.mark.parametrize("rows", [True, False])
+def test_entropy_without_full_table(lexicon, monkeypatch, rows):
+    monkeypatch.setattr(strategies, "TABLE_LIMIT", 0)  # As for a 6-8 letter list: rank a sample of the candidates
+    monkeypatch.setattr(strategies, "SAMPLE_LIMIT", 40)
+    if not rows:
+        monkeypatch.setattr(strategies, "load_pattern_rows", None)
+    game = Game(lexicon, 20)
+    strategy = Entropy(lexicon.words)
+    for answer in lexicon.words[::25]:
+        assert game.play(strategy, answer) is not None and game.guesses[-1] == answer
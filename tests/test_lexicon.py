@@ -0,0 +1,52 @@
+import random
+import pytest
+from helpers import LENGTHS, LETTERS, random_words
+from scoring import score
+from lexicon import Lexicon
+
+'''test_lexicon.py checks the Lexicon bitset queries (consistent, at_least, indices_in) against filtering the word
+list directly. Run with "python -m pytest tests".'''
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_consistent_matches_brute_force(length):
+    words = random_words(length)
+    lexicon = Lexicon(words)
+    rng = random.Random(length)
+    for guess in rng.sample(words, 10):
+        for code in {score(guess, answer) for answer in rng.sample(words, 10)} | {0}:
+            expected = [word for word in words if score(guess, word) == code]
+            assert lexicon.words_in(lexicon.consistent(guess, code)) == expected
+            assert [words[num] for num in lexicon.indices_in(lexicon.consistent(guess, code))] == expected
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_consistent_narrows_a_mask(length):
+    words = random_words(length)
+    lexicon = Lexicon(words)
+    answer, first, second = random.Random(length).sample(words, 3)
+    mask = lexicon.consistent(first, score(first, answer))
+    mask = lexicon.consistent(second, score(second, answer), mask)
+    assert lexicon.words_in(mask) == [word for word in words if score(first, word) == score(first, answer)
+                                      and score(second, word) == score(second, answer)]
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_at_least_matches_brute_force(length):
+    words = random_words(length)
+    lexicon = Lexicon(words)
+    for letter in sorted(set(LETTERS)) + ["z"]:
+        for copies in range(0, length + 2):
+            expected = [word for word in words if word.count(letter) >= copies]
+            assert lexicon.words_in(lexicon.at_least(letter, copies)) == expected
+
+
+def test_membership_and_counts():
+    words = random_words(5)
+    lexicon = Lexicon(words)
+    mask = lexicon.consistent(words[0], score(words[0], words[1]))
+    assert all(word in lexicon for word in words) and "zzzzz" not in lexicon
+    assert lexicon.count(lexicon.all) == len(words)
+    assert lexicon.count(mask) == len(lexicon.words_in(mask))
+    assert [word for word in words if lexicon.allows(word, mask)] == lexicon.words_in(mask)
+    assert not lexicon.allows("zzzzz", lexicon.all)
@@ -0,0 +1,46 @@
+import random
+import pytest
+from helpers import random_words
+from scoring import score, all_green
+from lexicon import Lexicon
+from game import NOT_WORD, WIN, LOSE, CONTINUE
+import multiboard
+from multiboard import MultiGame
+
+'''test_multiboard.py plays MultiGame: each guess is scored on every board still open, solved boards are left alone,
+and the game is won once every board is solved, with or without NumPy. Run with "python -m pytest tests".'''
+
+
+@pytest.fixture(params=["table", "scoring"])
+def lexicon(request, monkeypatch):
+    if request.param == "scoring":
+        monkeypatch.setattr(multiboard, "load_pattern_table", None)
+    return Lexicon(random_words(5))
+
+
+def test_submit_scores_every_open_board(lexicon):
+    game = MultiGame(lexicon, 4)
+    answers = lexicon.words[:4]
+    game.reset(answers)
+    assert game.max_tries == 9 and game.answer == ", ".join(answers)
+    assert game.submit("zzzzz") == NOT_WORD and game.tries == 1
+    guess = lexicon.words[10]
+    assert game.submit(guess) == CONTINUE
+    assert game.codes == [[score(guess, answer) for answer in answers]]
+    assert game.submit(answers[2]) == CONTINUE
+    assert game.solved == [None, None, 2, None] and game.unsolved() == [0, 1, 3] and game.remaining() == 3
+    assert game.codes[-1][2] == all_green(5)
+    game.submit(guess)
+    assert game.codes[-1] == [score(guess, answers[0]), score(guess, answers[1]), None, score(guess, answers[3])]
+
+
+def test_win_and_lose(lexicon):
+    answers = random.Random(2).sample(lexicon.words, 4)
+    game = MultiGame(lexicon, 4)
+    game.reset(answers)
+    assert [game.submit(answer) for answer in reversed(answers)] == [CONTINUE, CONTINUE, CONTINUE, WIN]
+    assert game.won and game.solved == [4, 3, 2, 1] and game.submit(answers[0]) is None
+    game = MultiGame(lexicon, 2, max_tries=2)
+    game.reset(answers[:2])
+    assert [game.submit(answers[0]), game.submit(answers[0])] == [CONTINUE, LOSE]
+    assert game.over and not game.won and game.unsolved() == [1]
@@ -0,0 +1,120 @@
+import types
+import pytest
+import helpers  # noqa: F401 (puts the project on sys.path)
+import scheduler
+from scheduler import Scheduler, Countdown
+
+'''test_scheduler.py runs the Scheduler against a fake Tk window and a fake monotonic clock: tasks run on their own
+intervals, runs missed while the mainloop was busy are skipped and counted, and a task that raises neither stops the
+others nor the ticking. Intervals are powers of two so the clock arithmetic is exact. Run with
+"python -m pytest tests".'''
+
+
+class FakeWindow:
+    def __init__(self, clock):
+        self.clock = clock
+        self.jobs = {}  # job id -> (time due, callback)
+        self.count = 0
+        self.errors = []
+
+    def after(self, ms, callback):
+        self.count += 1
+        self.jobs[self.count] = (self.clock.now + ms / 1000, callback)
+        return self.count
+
+    def after_cancel(self, job):
+        del self.jobs[job]
+
+    def report_callback_exception(self, kind, value, traceback):
+        self.errors.append(kind)
+
+    # ------ Fire the next callback, late if the clock is already past it ------
+    def fire(self):
+        job = min(self.jobs, key=lambda job: self.jobs[job][0])
+        due, callback = self.jobs.pop(job)
+        self.clock.now = max(self.clock.now, due)
+        callback()
+
+    def run_until(self, end):
+        while self.jobs and min(due for due, callback in self.jobs.values()) <= end:
+            self.fire()
+        self.clock.now = end
+
+
+@pytest.fixture
+def window(monkeypatch):
+    clock = types.SimpleNamespace(now=0.0)
+    monkeypatch.setattr(scheduler, "time", types.SimpleNamespace(monotonic=lambda: clock.now))
+    return FakeWindow(clock)
+
+
+def test_tasks_run_on_their_own_intervals(window):
+    runs = {"fast": [], "slow": []}
+    ticker = Scheduler(window, 0.25)
+    ticker.add(runs["fast"].append)
+    ticker.add(runs["slow"].append, 0.5)
+    window.run_until(2)
+    assert runs == {"fast": [0.25 * num for num in range(1, 9)], "slow": [0.5 * num for num in range(1, 5)]}
+    assert ticker.stats()["max"] == 0 and len(window.jobs) == 1
+
+
+def test_missed_runs_are_skipped_and_counted(window):
+    runs = []
+    ticker = Scheduler(window, 0.25)
+    ticker.add(runs.append)
+    window.clock.now = 0.875  # The mainloop was busy past the runs due at 0.5 and 0.75
+    window.fire()
+    window.run_until(1.5)
+    assert runs == [0.875, 1.0, 1.25, 1.5]  # Back on the 0.25 s grid
+    assert ticker.skipped[runs.append] == 2 and ticker.stats()["max"] == pytest.approx(625)
+
+
+def test_task_that_raises_is_reported_and_others_keep_running(window):
+    runs = []
+
+    def broken(now):
+        raise RuntimeError("boom")
+
+    ticker = Scheduler(window, 0.25)
+    ticker.add(broken)
+    ticker.add(runs.append)
+    window.run_until(1)
+    assert runs == [0.25, 0.5, 0.75, 1.0] and window.errors == [RuntimeError] * 4
+
+
+def test_stands_down_when_the_last_task_removes_itself(window):
+    runs = []
+    ticker = Scheduler(window, 0.25)
+
+    def once(now):
+        runs.append(now)
+        ticker.remove(once)
+
+    ticker.add(once)
+    window.run_until(1)
+    assert runs == [0.25] and not window.jobs
+    ticker.add(once)
+    window.run_until(2)
+    assert runs == [0.25, 1.25]
+
+
+def test_adding_a_sooner_task_rearms_the_callback(window):
+    runs = []
+    ticker = Scheduler(window, 1)
+    ticker.add(lambda now: None)
+    ticker.add(runs.append, 0.25)
+    assert len(window.jobs) == 1 and list(window.jobs.values())[0][0] == 0.25
+    window.run_until(0.5)
+    assert runs == [0.25, 0.5]
+
+
+def test_countdown():
+    countdown = Countdown(45)
+    assert countdown.remaining() == 45 and not countdown.running() and not countdown.expired()
+    countdown.start(now=10)
+    assert countdown.running() and countdown.remaining(20) == 35 and not countdown.expired(54.5)
+    assert countdown.remaining(60) == 0 and countdown.expired(55)
+    countdown.start(now=100, seconds=5)
+    assert countdown.remaining(101) == 4
+    countdown.stop()
+    assert countdown.remaining(200) == 45 and not countdown.expired(200)
@@ -0,0 +1,54 @@
+import pytest
+from helpers import LENGTHS, brute_score, random_words
+from scoring import score, colors
+try:
+    import numpy as np
+    from pattern_table import pattern_matrix, PatternRows
+except ImportError:  # NumPy not installed: the table tests are skipped
+    pattern_matrix = None
+
+'''test_scoring.py checks scoring.py against brute force (with the NYT repeated-letter rules) and the NumPy pattern
+table (and the rows scored on demand for lists too long for one) against scoring.py. Run with
+"python -m pytest tests".'''
+
+
+@pytest.mark.parametrize("guess, answer, expected", [
+    ("speed", "abide", ["gray", "gray", "yellow", "gray", "yellow"]),
+    ("abide", "speed", ["gray", "gray", "gray", "yellow", "yellow"]),
+    ("babes", "abbey", ["yellow", "yellow", "green", "green", "gray"]),
+    ("abbey", "babes", ["yellow", "yellow", "green", "green", "gray"]),
+    ("eerie", "there", ["yellow", "gray", "yellow", "gray", "green"]),
+    ("crane", "crane", ["green"] * 5),
+])
+def test_score_repeated_letters(guess, answer, expected):
+    assert colors(score(guess, answer), len(guess)) == expected
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_score_matches_brute_force(length):
+    words = random_words(length, 120)
+    for guess in words:
+        for answer in words:
+            assert score(guess, answer) == brute_score(guess, answer)
+
+
+@pytest.mark.skipif(pattern_matrix is None, reason="needs NumPy")
+@pytest.mark.parametrize("length", LENGTHS)
+def test_pattern_matrix_matches_score(length):
+    words = random_words(length, 150)
+    matrix = pattern_matrix(words)
+    assert [[int(code) for code in row] for row in matrix] == [[score(guess, answer) for answer in words]
+                                                               for guess in words]
+
+
+@pytest.mark.skipif(pattern_matrix is None, reason="needs NumPy")
+@pytest.mark.parametrize("length", LENGTHS)
+def test_pattern_rows_match_table(length):
+    words = random_words(length, 150)
+    matrix = pattern_matrix(words)
+    rows = PatternRows(words)
+    answers = np.arange(0, len(words), 3)
+    for guess in range(0, len(words), 7):
+        assert rows[guess, answers].tolist() == matrix[guess, answers].tolist()
+    guesses = np.arange(0, len(words), 5)
+    assert rows[np.ix_(guesses, answers)].tolist() == matrix[np.ix_(guesses, answers)].tolist()
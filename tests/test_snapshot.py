@@ -0,0 +1,27 @@
+from helpers import random_words
+from lexicon import Lexicon
+from game import Game
+from snapshot import pack_state, unpack_state
+
+'''test_snapshot.py checks that a packed game unpacks to the same answer, guesses and time, and that a snapshot is
+refused by a game with other rules or another word list. Run with "python -m pytest tests".'''
+
+
+def test_snapshot_round_trip():
+    lexicon = Lexicon(random_words(5))
+    game = Game(lexicon, 6)
+    game.reset(lexicon.words[7])
+    for guess in lexicon.words[20:23]:
+        game.submit(guess)
+    state = unpack_state(pack_state(game, 12.345), game)
+    assert state == (game.answer, game.guesses, 12.345)
+
+
+def test_snapshot_rejects_other_rules():
+    lexicon = Lexicon(random_words(5))
+    game = Game(lexicon, 6)
+    data = pack_state(game, 10)
+    assert unpack_state(data, Game(lexicon, 7)) is None
+    assert unpack_state(data, Game(lexicon, 6, hard_mode=True)) is None
+    assert unpack_state(data, Game(Lexicon(random_words(5, seed=1)), 6)) is None
+    assert unpack_state(data[:5], game) is None
@@ -0,0 +1,64 @@
+import os
+import json
+import random
+import pytest
+from stats import StatsLog, valid_record
+
+'''test_stats.py checks the stats counters against a brute-force recount of the games, and that catching up on the log
+skips lines that are not game records and cuts off a half-written last line. Run with "python -m pytest tests".'''
+
+
+def test_fold_matches_brute_force(tmp_path):
+    rng = random.Random(3)
+    records = []
+    for _ in range(0, 200):
+        won = rng.random() < 0.7
+        tries = rng.randint(1, 8)
+        records.append({"answer": "crane", "guesses": ["slate"] * tries, "won": won,
+                        "timeout": not won and rng.random() < 0.3, "times": [rng.uniform(0, 45) for _ in range(tries)]})
+    log = StatsLog(str(tmp_path))
+    for record in records:
+        log.fold(record)
+    summary = log.summary()
+    wins = [record for record in records if record["won"]]
+    streaks = [0]
+    for record in records:
+        streaks.append(streaks[-1] + 1 if record["won"] else 0)
+    assert summary["games"] == len(records)
+    assert summary["win_rate"] == len(wins) / len(records)
+    assert summary["streak"] == streaks[-1]
+    assert summary["max_streak"] == max(streaks)
+    assert summary["timeouts"] == sum(1 for record in records if record["timeout"])
+    assert summary["distribution"] == [sum(1 for record in wins if len(record["guesses"]) == tries)
+                                       for tries in range(1, len(summary["distribution"]) + 1)]
+    times = [seconds for record in records for seconds in record["times"]]
+    assert summary["seconds_per_guess"] == pytest.approx(sum(times) / len(times))
+
+
+def test_catch_up_skips_bad_lines_and_torn_tail(tmp_path):
+    good = {"answer": "crane", "guesses": ["slate", "crane"], "won": True, "timeout": False, "times": [3.0, 4.0]}
+    lines = [json.dumps(good), "{not json", json.dumps([1, 2]), json.dumps({"answer": "crane"}),
+             json.dumps({"guesses": [], "won": True}), json.dumps(dict(good, won=False))]
+    with open(os.path.join(tmp_path, "games.log"), "w") as file:
+        file.write("\n".join(lines) + "\n" + '{"answer": "cra')
+    log = StatsLog(str(tmp_path))
+    assert log.summary()["games"] == 2
+    assert log.torn == log.counters["offset"] == sum(len(line) + 1 for line in lines)
+    log.append(*log.add(good))
+    with open(os.path.join(tmp_path, "games.log")) as file:
+        assert file.read().splitlines()[-1] == json.dumps(good)
+    os.remove(os.path.join(tmp_path, "stats.json"))  # Recount everything from the log
+    assert StatsLog(str(tmp_path)).summary() == log.summary()
+
+
+@pytest.mark.parametrize("record, valid", [
+    ({"guesses": ["slate"], "won": True}, True),
+    ({"guesses": [], "won": False, "times": [None, 2]}, True),
+    ({"guesses": [], "won": True}, False),
+    ({"guesses": "slate", "won": True}, False),
+    ({"guesses": ["slate"], "won": 1}, False),
+    ({"guesses": ["slate"], "won": True, "times": ["3"]}, False),
+    (["slate"], False),
+])
+def test_valid_record(record, valid):
+    assert valid_record(record) == valid
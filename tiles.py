@@ -38,3 +38,132 @@ class LetterKey(Button):
                        bg=self._kwargs["properties"]["bg"], fg=self._kwargs["properties"]["fg"],
                        command=self._kwargs["command"])
         self.grid(column=self._kwargs["column"], row=0, padx=2, pady=2)
+
+
+# ------ Board of rows x columns Tile widgets, one Tier per row (the original layout, kept for comparison) ------
+class TileGrid:
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs["kwargs"]
+        self._properties = self._kwargs["properties"]
+        self.tiles = {}
+        for row in range(0, self._kwargs["rows"]):
+            tier = Tier(kwargs={"row": self._kwargs["row"] + row})
+            for column in range(0, self._kwargs["columns"]):
+                self.tiles[(row, column)] = Tile(tier, kwargs={"column": column, "row": 0,
+                                                               "properties": self._properties})
+
+    def set_letter(self, row, column, text):
+        tile = self.tiles[(row, column)]
+        tile.itemconfig(tile.letter, text=text)
+
+    def set_colors(self, row, column, text, bg, fg):
+        tile = self.tiles[(row, column)]
+        tile.configure(bg=bg)
+        tile.itemconfig(tile.letter, text=text, fill=fg)
+
+    def clear(self):
+        for tile in self.tiles.values():
+            tile.configure(bg=self._properties["bg"])
+            tile.itemconfig(tile.letter, text="", fill=self._properties["ink"])
+
+
+# ------ Board drawn as rectangle and text items on one Canvas, sized from the number of rows and columns ------
+class CanvasBoard(Canvas):
+    def __init__(self, **kwargs):
+        super().__init__()
+        self._kwargs = kwargs["kwargs"]
+        self._properties = self._kwargs["properties"]
+        size = self._properties["size"]
+        gap = self._properties["gap"]
+        rows = self._kwargs["rows"]
+        columns = self._kwargs["columns"]
+        boards = self._kwargs.get("boards", 1)  # Multi-board mode: boards side by side, columns numbered on in turn
+        across = self._kwargs.get("across", boards)  # Boards per line
+        down = -(-boards // across)
+        spacing = self._properties.get("spacing", 0)  # Between boards
+        board_width = columns * (size + gap) + gap
+        board_height = rows * (size + gap) + gap
+        self.configure(width=across * (board_width + spacing) - spacing,
+                       height=down * (board_height + spacing) - spacing, bg=self._properties["bg"],
+                       highlightthickness=0)
+        self.tiles = {}
+        self.letters = {}
+        self.boxes = {}  # (row, column) -> (x0, y0, x1, y1) of the tile at rest
+        for board in range(0, boards):
+            left = (board % across) * (board_width + spacing)
+            top = (board // across) * (board_height + spacing)
+            for row in range(0, rows):
+                for column in range(0, columns):
+                    x = left + gap + column * (size + gap)
+                    y = top + gap + row * (size + gap)
+                    cell = (row, board * columns + column)
+                    self.boxes[cell] = (x, y, x + size, y + size)
+                    self.tiles[cell] = self.create_rectangle(x, y, x + size, y + size, width=2, tags="tile",
+                                                             fill=self._properties["bg"],
+                                                             outline=self._properties["outline"])
+                    self.letters[cell] = self.create_text(x + size / 2, y + size / 2, text="", tags="letter",
+                                                          font=self._properties["font"],
+                                                          fill=self._properties["ink"])
+        self.grid(column=0, row=self._kwargs["row"], columnspan=12)
+
+    def set_letter(self, row, column, text):
+        self.itemconfig(self.letters[(row, column)], text=text)
+
+    def set_colors(self, row, column, text, bg, fg):
+        self.itemconfig(self.tiles[(row, column)], fill=bg, outline=bg)
+        self.itemconfig(self.letters[(row, column)], text=text, fill=fg)
+
+    # ------ Stretch a tile about its center (animations); one coords call ------
+    def scale_tile(self, row, column, scale_x, scale_y):
+        x0, y0, x1, y1 = self.boxes[(row, column)]
+        half_x = (x1 - x0) * scale_x / 2
+        half_y = (y1 - y0) * scale_y / 2
+        self.coords(self.tiles[(row, column)], (x0 + x1) / 2 - half_x, (y0 + y1) / 2 - half_y,
+                    (x0 + x1) / 2 + half_x, (y0 + y1) / 2 + half_y)
+
+    # ------ Blank every tile with two tag-wide calls ------
+    def clear(self):
+        self.itemconfig("tile", fill=self._properties["bg"], outline=self._properties["outline"])
+        self.itemconfig("letter", text="", fill=self._properties["ink"])
+
+
+# ------ One colored part of a CanvasKeyboard key; configure() matches LetterKey's so BoardRenderer can paint it ------
+class KeySegment:
+    def __init__(self, canvas, item):
+        self.canvas = canvas
+        self.item = item
+
+    def configure(self, bg, fg=None):
+        self.canvas.itemconfig(self.item, fill=bg)
+
+
+# ------ On-screen keyboard on one Canvas; each key is split into one segment per board, colored separately ------
+class CanvasKeyboard(Canvas):
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent)
+        self._kwargs = kwargs["kwargs"]
+        self._properties = self._kwargs["properties"]
+        width = self._properties["width"]
+        height = self._properties["height"]
+        gap = self._properties["gap"]
+        boards = self._kwargs["boards"]
+        across = -(-boards // 2) if boards > 1 else 1  # Segments per line of a key
+        down = -(-boards // across)
+        self.configure(width=10 * (width + gap) + gap, height=3 * (height + gap) + gap, bg=self._properties["bg"],
+                       highlightthickness=0)
+        self.segments = {}  # (letter, board) -> KeySegment
+        for line, letters in enumerate(("qwertyuiop", "asdfghjkl", "zxcvbnm")):
+            for num, letter in enumerate(letters):
+                x = gap + line * (width + gap) / 2 + num * (width + gap)
+                y = gap + line * (height + gap)
+                for board in range(0, boards):
+                    left = x + (board % across) * width / across
+                    top = y + (board // across) * height / down
+                    item = self.create_rectangle(left, top, left + width / across, top + height / down, outline="",
+                                                 fill=self._properties["key_bg"], tags=f"key-{letter}")
+                    self.segments[(letter, board)] = KeySegment(self, item)
+                self.create_text(x + width / 2, y + height / 2, text=letter.upper(), font=self._properties["font"],
+                                 fill=self._properties["ink"], tags=f"key-{letter}")
+                self.tag_bind(f"key-{letter}", "<Button-1>",
+                              lambda event, letter=letter: self._kwargs["command"](letter))
+        self.grid(column=0, row=0, columnspan=10)
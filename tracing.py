@@ -0,0 +1,108 @@
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+from collections import deque, defaultdict
+from functools import wraps
+from contextlib import nullcontext
+
+'''tracing.py times the hot paths of the game (input, scoring, rendering, loading the word list) so a slow key press
+can be pinned on one stage. It is off unless the WORDLE_TRACE environment variable is set or "--trace" is on the
+command line; when off, @traced hands back the function untouched and section() returns a shared no-op, so there is
+nothing to pay. When on, every span is kept in memory and, at exit, written as Chrome trace-event JSON (open it in
+chrome://tracing or ui.perfetto.dev) to the path in WORDLE_TRACE, or wordle-trace.json, and p50/p95/p99 per stage are
+printed.'''
+
+
+# ------ Constants ------
+ENABLED = bool(os.environ.get("WORDLE_TRACE")) or "--trace" in sys.argv
+TRACE_PATH = os.environ.get("WORDLE_TRACE") if os.environ.get("WORDLE_TRACE") not in (None, "", "1") \
+    else "wordle-trace.json"
+SPAN_LIMIT = 200000  # Most recent spans kept
+
+
+class Tracer:
+    def __init__(self):
+        self.spans = deque(maxlen=SPAN_LIMIT)  # (name, start, end, thread id), times from perf_counter_ns
+        self.origin = time.perf_counter_ns()
+
+    def record(self, name, start, end):
+        self.spans.append((name, start, end, threading.get_ident()))
+
+    # ------ Chrome trace-event JSON: one complete ("X") event per span, times in microseconds ------
+    def export(self, path):
+        events = [{"name": name, "cat": "wordle", "ph": "X", "pid": os.getpid(), "tid": thread,
+                   "ts": (start - self.origin) / 1000, "dur": (end - start) / 1000}
+                  for name, start, end, thread in self.spans]
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+    # ------ Per stage: span count and p50/p95/p99/max in milliseconds ------
+    def summary(self):
+        durations = defaultdict(list)
+        for name, start, end, _ in self.spans:
+            durations[name].append((end - start) / 1e6)
+        stages = {}
+        for name, samples in durations.items():
+            samples.sort()
+            stages[name] = {"count": len(samples), "p50": percentile(samples, 0.50), "p95": percentile(samples, 0.95),
+                            "p99": percentile(samples, 0.99), "max": samples[-1]}
+        return stages
+
+
+class Section:
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc):
+        tracer.record(self.name, self.start, time.perf_counter_ns())
+
+
+def percentile(samples, fraction):
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+# ------ Decorator: time every call of a function (returns it unchanged when tracing is off) ------
+def traced(function):
+    if not ENABLED:
+        return function
+    name = function.__qualname__
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            tracer.record(name, start, time.perf_counter_ns())
+    return wrapper
+
+
+# ------ Time a block: with section("paint"): ... ------
+_off = nullcontext()
+
+
+def section(name):
+    return Section(name) if ENABLED else _off
+
+
+# ------ Write the trace and print the summary when the program ends ------
+def finish():
+    if not tracer.spans:
+        return
+    tracer.export(TRACE_PATH)
+    print(f"Trace of {len(tracer.spans)} spans written to {TRACE_PATH}", file=sys.stderr)
+    print(f"{'stage':<32}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}", file=sys.stderr)
+    for name, stage in sorted(tracer.summary().items()):
+        print(f"{name:<32}{stage['count']:>8}{stage['p50']:>10.3f}{stage['p95']:>10.3f}{stage['p99']:>10.3f}"
+              f"{stage['max']:>10.3f}", file=sys.stderr)
+
+
+tracer = Tracer()
+if ENABLED:
+    atexit.register(finish)
@@ -0,0 +1,214 @@
+import os
+import json
+import mmap
+import struct
+import time
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from tracing import traced
+
+'''wordlist.py keeps a local, precompiled copy of the Wordle word list for Wordle_FinalProject.py. The five-letter list
+is downloaded from Knuth's sgb-words.txt once, filtered, and written to disk as fixed-width 5-byte records behind a small
+versioned header so that later launches can memory-map it instead of waiting on the network. When a cached copy exists
+it is returned right away and revalidated in the background with a conditional request; if the network is unavailable
+the cached copy is simply kept. Requests share one pooled session that retries transient failures with backoff, and
+WordlistLoader runs the whole load on a background thread so the window can come up before the list is ready. Other
+word lengths (4 to 8 letters) come from a general English word list instead, each cached in its own file the first
+time that length is played.'''
+
+
+# ------ Constants ------
+WORDS_URL = os.environ.get("WORDLE_WORDS_URL", "https://www-cs-faculty.stanford.edu/~knuth/sgb-words.txt")
+ALL_WORDS_URL = os.environ.get("WORDLE_ALL_WORDS_URL",
+                               "https://raw.githubusercontent.com/dwyl/english-words/master/words_alpha.txt")
+CACHE_DIR = os.environ.get("WORDLE_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache"))
+CACHE_VERSION = 1  # Bump whenever the filtering below changes so that old caches are rebuilt
+WORD_LENGTH = 5  # Default length; Knuth's list only has five-letter words
+LENGTHS = range(4, 9)
+LIST_SIZE = 3417  # Knuth's list is sorted by frequency; the first half holds the most popular words
+TIMEOUT = (3.05, 5)  # Seconds to connect, seconds between bytes read
+RETRIES = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET"]))
+MAGIC = b"WRDL"
+HEADER = struct.Struct("<4sBBI")  # magic, cache version, word length, word count
+
+REMOVE_LIST = frozenset(['slave', 'schwa', 'polio', 'didst', 'anode', 'lathe', 'dikes', 'bosom', 'imply', 'rotor', 'urine',
+                         'nymph', 'asses', 'thine', 'sexes', 'daddy', 'emery', 'sunup', 'sloop', 'radii', 'booby', 'tepee',
+                         'outdo', 'ketch', 'copra', 'tapir', 'floes', 'kinks', 'franc', 'mamma', 'rondo', 'jambs', 'lyres',
+                         'conic', 'shalt', 'abbot', 'mikes', 'aster', 'cocci', 'umbra', 'voile', 'sulfa', 'civet', 'kinky',
+                         'rills', 'ovule', 'enrol', 'gauss', 'bayed', 'larch', 'mamas', 'phlox', 'ingot', 'flied', 'dells',
+                         'whelk', 'feted', 'cocos', 'sirup', 'laths', 'lodes', 'prows', 'etude', 'copse', 'boned', 'heres',
+                         'haves', 'hells', 'soled', 'aping', 'quaff', 'rajah', 'scull', 'lores', 'ameba', 'adzes', 'ivies',
+                         'papaw', 'jells', 'cruet', 'laxly', 'rends', 'loams', 'viler', 'lolls', 'diked', 'lowed', 'bests',
+                         'boner', 'avers', 'pares', 'kales', 'arced', 'acnes', 'neons', 'fiefs', 'dints', 'yules', 'lilts',
+                         'beefs', 'fells', 'lames', 'jawed', 'dupes', 'deads', 'noons', 'vireo', 'metes', 'sedge', 'papas',
+                         'wheys', 'hilts', 'beaus', 'gists', 'yogas', 'zeals', 'soots', 'cress', 'doffs', 'biers', 'suets',
+                         'hobos', 'lints', 'brans', 'teals', 'garbs', 'pewee', 'wends', 'banes', 'napes', 'pyres', 'bides',
+                         'veals', 'dirks', 'tippy', 'piths', 'whets', 'wools', 'dirts', 'jutes', 'hemps', 'okapi', 'dusks',
+                         'sears', 'novae', 'murks', 'slues', 'saris', 'dills', 'meany', 'bunts', 'razes', 'ruses', 'vends',
+                         'judos', 'pulps', 'mucks', 'vises', 'gotta', 'fugue', 'radix', 'cubit', 'versa', 'adieu', 'terns',
+                         'junta', 'alpha', 'prick', 'ephod', 'veldt', 'bream', 'rosin', 'bolls', 'doers', 'downs', 'humph',
+                         'fella', 'mould', 'beryl', 'brier', 'canst', 'quoth', 'lemme', 'tenon', 'deeps', 'padre', 'leant',
+                         'quipu', 'manna', 'duple', 'boron', 'revue', 'alack', 'inter', 'dilly', 'whist', 'spake', 'loess',
+                         'lingo', 'dunno', 'sissy', 'calyx', 'coons', 'piney', 'lemma', 'whirr', 'saith', 'ionic', 'harem',
+                         'dross', 'farad', 'jingo', 'bower', 'facto', 'toves', 'basal', 'yella', 'hymen', 'scrip', 'swash',
+                         'aleph', 'tinny', 'wanta', 'trice', 'garde', 'sower', 'penal', 'sonny', 'quirt', 'mebbe', 'xenon',
+                         'hullo', 'negro', 'hadst', 'aloes', 'quint', 'raped', 'salvo', 'hertz', 'xylem', 'cohos', 'sorta',
+                         'gamba', 'axial', 'aleck', 'siree', 'bandy', 'gunny', 'runic', 'whizz', 'ochre', 'edger', 'gimme',
+                         'theta', 'dykes', 'servo', 'telly', 'blocs', 'vitae', 'bronc', 'tabor', 'comer', 'borer', 'sired',
+                         'privy', 'mammy', 'deary', 'quire', 'thugs', 'anion', 'fagot', 'letup', 'eyrie', 'axons', 'umber',
+                         'miler', 'fibre', 'vitro', 'mater', 'umped', 'newel', 'treed', 'rangy', 'brads', 'mommy', 'motes',
+                         'imams', 'hallo', 'canto', 'idyll', 'laity', 'ducal', 'metre', 'unary', 'goeth', 'baler', 'sited',
+                         'hasps', 'brung', 'holed', 'swank', 'looky', 'loamy', 'pimps', 'shunt', 'seder', 'annas', 'coypu',
+                         'shims', 'zowie'])  # Words that may be inappropriate or too obscure
+
+
+# ------ Pooled HTTP session, shared by the first download and background revalidation ------
+_session = None
+_session_lock = threading.Lock()
+
+
+def session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.mount("https://", HTTPAdapter(max_retries=RETRIES, pool_maxsize=2))
+            _session.mount("http://", HTTPAdapter(max_retries=RETRIES, pool_maxsize=2))
+        return _session
+
+
+# ------ Where each length's words come from ------
+def source_url(length=WORD_LENGTH):
+    return WORDS_URL if length == WORD_LENGTH else ALL_WORDS_URL
+
+
+# ------ Cache file locations ------
+def cache_paths(length=WORD_LENGTH):
+    name = os.path.join(CACHE_DIR, f"words-v{CACHE_VERSION}")
+    if length != WORD_LENGTH:
+        name += f"-{length}"
+    return name + ".bin", name + ".json"
+
+
+# ------ Filter downloaded text (runs once, at cache-build time) ------
+def filter_words(data, length=WORD_LENGTH):
+    word_list = []
+    for line in data.split():
+        if len(line) == length and line.isalpha() and line.islower() and line not in REMOVE_LIST:
+            word_list.append(line)
+    if length == WORD_LENGTH:
+        return word_list[:LIST_SIZE]
+    return word_list  # The general list is alphabetical, so there are no "most popular" words to keep
+
+
+# ------ Write word list and HTTP validators to disk ------
+def write_cache(words, validators, length=WORD_LENGTH):
+    bin_path, meta_path = cache_paths(length)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    records = "".join(words).encode("ascii")
+    with open(bin_path + ".tmp", "wb") as file:
+        file.write(HEADER.pack(MAGIC, CACHE_VERSION, length, len(words)))
+        file.write(records)
+    with open(meta_path + ".tmp", "w") as file:
+        json.dump(validators, file)
+    os.replace(bin_path + ".tmp", bin_path)  # Swap files in atomically so a crash never leaves half a cache
+    os.replace(meta_path + ".tmp", meta_path)
+
+
+# ------ Read word list from disk (None if missing or unusable) ------
+def read_cache(length=WORD_LENGTH):
+    bin_path = cache_paths(length)[0]
+    try:
+        with open(bin_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            magic, version, stored_length, count = HEADER.unpack_from(buffer)
+            if magic != MAGIC or version != CACHE_VERSION or stored_length != length:
+                return None
+            if len(buffer) != HEADER.size + count * length:
+                return None
+            records = buffer[HEADER.size:].decode("ascii")
+    except (OSError, ValueError, struct.error):
+        return None
+    return [records[num:num + length] for num in range(0, len(records), length)]
+
+
+def read_validators(length=WORD_LENGTH):
+    try:
+        with open(cache_paths(length)[1]) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+# ------ Download word list, conditionally if validators are known (None if unchanged) ------
+@traced
+def fetch_wordlist(validators=None, length=WORD_LENGTH):
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    response = session().get(source_url(length), headers=headers, timeout=TIMEOUT)
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+    words = filter_words(response.text, length)
+    try:
+        write_cache(words, {"etag": response.headers.get("ETag"),
+                            "last_modified": response.headers.get("Last-Modified")}, length)
+    except OSError:  # Cache directory not writable: the game still works, it just downloads again next time
+        pass
+    return words
+
+
+# ------ Revalidate cached copy; the refreshed list is picked up on the next launch ------
+def revalidate(length=WORD_LENGTH):
+    try:
+        fetch_wordlist(read_validators(length), length)
+    except requests.RequestException:  # No network: keep the cached copy
+        pass
+
+
+# ------ Load word list, from cache when possible ------
+def load_wordlist(length=WORD_LENGTH):
+    words = read_cache(length)
+    if words:
+        threading.Thread(target=revalidate, args=(length,), daemon=True).start()
+        return words
+    return fetch_wordlist(length=length)
+
+
+# ------ Load the word list on a background thread; poll() from the Tk mainloop hands over the result ------
+class WordlistLoader:
+    def __init__(self, length=WORD_LENGTH, prepare=None):
+        self.length = length
+        self.prepare = prepare  # Optional function run on the words in the background too, e.g. building a Lexicon
+        self.result = None
+        self.error = None
+        self.seconds = None  # How long the last load took
+        self._thread = None
+
+    def start(self):
+        self.result = self.error = self.seconds = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @traced
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            words = load_wordlist(self.length)
+            self.result = self.prepare(words) if self.prepare else words
+        except requests.RequestException as error:  # No cache and no network: the UI offers to try again
+            self.error = error
+        self.seconds = time.perf_counter() - start
+
+    def busy(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    # ------ Result once loaded, None while loading or after a failure (see error) ------
+    def poll(self):
+        return None if self.busy() else self.result